@@ -1,8 +1,9 @@
 from enum import Enum, auto
 from dataclasses import dataclass
 from typing import Optional
-from real_estate_toolkit.agent_based_model.houses import House, QualityScore
+from real_estate_toolkit.agent_based_model.houses import House
 from real_estate_toolkit.agent_based_model.house_market import HousingMarket
+from real_estate_toolkit.agent_based_model.savings import project_savings
 
 class Segment(Enum):
     FANCY = auto()
@@ -20,33 +21,28 @@ class Consumer:
     saving_rate: float = 0.3
     interest_rate: float = 0.05
 
-    def compute_savings(self, years: int) -> None:
-        for year in range(years):
-            self.savings += self.annual_income * self.saving_rate
-            self.savings *= (1 + self.interest_rate)
+    def __setattr__(self, name, value):
+        #house Goes Through the Market: Sells it if Available, Counts the Owner
+        if name == "house":
+            previous = getattr(self, "house", None)
+            if previous is not None and previous is not value and previous.market is not None:
+                previous.market._owner_removed(self.id)
+            if value is not None and value.market is not None:
+                value.market._owner_added(value, self.id)
+        object.__setattr__(self, name, value)
 
-        self.savings = round(self.savings, 2)
+    def compute_savings(self, years: int) -> None:
+        #Closed Form (no per-year loop)
+        trajectory = project_savings(self.savings, self.annual_income, self.saving_rate,
+                                     self.interest_rate, years)
+        self.savings = round(float(trajectory[0, -1]), 2)
 
     def buy_a_house(self, housing_market: HousingMarket) -> None:
-        suitableHouses = []
-
-        if self.segment == Segment.FANCY:
-            suitableHouses = [house for house in housing_market.houses
-                               if house.is_new_construction()
-                               and house.quality_score == QualityScore.EXCELLENT]
-        elif self.segment == Segment.OPTIMIZER:
-            monthly_income = self.annual_income / 12
-            suitableHouses = [house for house in housing_market.houses
-                               if house.calculate_price_per_square_foot() < monthly_income]
-        elif self.segment == Segment.AVERAGE:
-            avgPrice = housing_market.calculate_average_price()
-            suitableHouses = [house for house in housing_market.houses
-                               if house.price < avgPrice]
-
-        for suitableHouse in suitableHouses:
-            if self.savings >= suitableHouse.price:
-                self.house = suitableHouse
-                self.savings -= suitableHouse.price
-                suitableHouse.sell_house()
-
-                break
+        #Segment Index Probe (FANCY: new + excellent, OPTIMIZER: price/sqft
+        #below monthly income, AVERAGE: below average price)
+        suitableHouse = housing_market.first_suitable_house(self.segment, self.savings, self.annual_income)
+
+        if suitableHouse is not None:
+            self.house = suitableHouse
+            self.savings -= suitableHouse.price
+            suitableHouse.sell_house(self.id)
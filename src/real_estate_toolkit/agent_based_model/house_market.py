@@ -1,5 +1,10 @@
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Dict, Tuple, Any
+from dataclasses import dataclass, asdict
+from bisect import bisect_right
+import numpy as np
+import polars as pl
 from real_estate_toolkit.agent_based_model.houses import House, QualityScore
+from real_estate_toolkit.agent_based_model.matching import FirstFitTree, FirstFitPairTree
 
 from enum import Enum
 class Segment(Enum):
@@ -9,34 +14,264 @@ class Segment(Enum):
     FAIR = 2
     POOR = 1
 
+@dataclass(slots=True)
+class MarketStatistics:
+    #Running Aggregates of One Group of Houses
+    count: int = 0
+    price_sum: float = 0.0
+    available_count: int = 0
+    available_price_sum: float = 0.0
+
+@dataclass(frozen=True, slots=True)
+class MarketEvent:
+    #One Sale (buyer_id is None when the buyer is unknown)
+    step: int
+    house_id: int
+    buyer_id: Optional[int]
+    price: float
+    bedrooms: int
+    quality: Optional[int]
+
 class HousingMarket:
     def __init__(self,
-                 houses: List[House]):
+                 houses: List[House],
+                 record_events: bool = True):
         self.houses: List[House] = houses
+        #Event Log (sales), Stamped With the Current Step
+        self.record_events: bool = record_events
+        self.events: List[MarketEvent] = []
+        self.step: int = 0
+        #Distinct Buyers (sell_house(buyer_id) and Consumer.house assignments)
+        self._owners: set = set()
+        self.reindex()
+
+  #Indexes
+    def reindex(self) -> None:
+        #Id -> House (first occurrence wins, like the linear scan)
+        self._housesById: Dict[int, House] = {}
+        #Running Sums (list order, so averages match a plain sum), Keyed
+        #("all", None), ("bedrooms", bedrooms) and ("quality", quality value)
+        self._stats: Dict[Tuple[str, Optional[int]], MarketStatistics] = {("all", None): MarketStatistics()}
+        #Price-Sorted (price, position) Per Quality Value
+        self._qualityIndex: Dict[int, Tuple[List[float], List[int]]] = {}
+        #Consumer Segment Candidates (built on first probe)
+        self._positions: Dict[int, int] = {id(house): position for position, house in enumerate(self.houses)}
+        self._segmentTrees: Optional[Dict[str, Any]] = None
+        #Set by Direct Writes to price/bedrooms/quality_score: Rebuild on Next Read
+        self._stale: bool = False
+
+        qualityPairs: Dict[int, List[Tuple[float, int]]] = {}
+        for position, house in enumerate(self.houses):
+            self._index_house(house)
+            if house.quality_score is not None:
+                qualityPairs.setdefault(house.quality_score.value, []).append((house.price, position))
+
+        for quality, pairs in qualityPairs.items():
+            pairs.sort()
+            self._qualityIndex[quality] = ([price for price, _ in pairs], [position for _, position in pairs])
+
+    def _groups(self, house: House) -> List[MarketStatistics]:
+        keys = [("all", None), ("bedrooms", house.bedrooms)]
+        if house.quality_score is not None:
+            keys.append(("quality", house.quality_score.value))
+
+        groups = []
+        for key in keys:
+            if key not in self._stats:
+                self._stats[key] = MarketStatistics()
+            groups.append(self._stats[key])
+        return groups
+
+    def _index_house(self, house: House) -> None:
+        self._housesById.setdefault(house.id, house)
+        price, available = house.price, house.available
+        for group in self._groups(house):
+            group.count += 1
+            group.price_sum += price
+            if available:
+                group.available_count += 1
+                group.available_price_sum += price
+        house.market = self
+        #Warm Derived Attributes (price per sqft, age, new construction)
+        house.calculate_price_per_square_foot()
+
+    def add_house(self, house: House) -> None:
+        position = len(self.houses)
+        self.houses.append(house)
+        self._index_house(house)
+        self._positions[id(house)] = position
+        #Average Price Changed: Rebuild Candidates on Next Probe
+        self._segmentTrees = None
+
+        if house.quality_score is not None:
+            prices, positions = self._qualityIndex.setdefault(house.quality_score.value, ([], []))
+            index = bisect_right(prices, house.price)
+            prices.insert(index, house.price)
+            positions.insert(index, position)
+
+    def _fresh(self) -> None:
+        if self._stale:
+            self.reindex()
+
+    def _house_sold(self, house: House, buyer_id: Optional[int] = None) -> None:
+        #Called by House.sell_house (and direct available writes): O(1) Aggregate Update + Event
+        house._set_available(False)
+        price = house.price
+        if not self._stale:
+            for group in self._groups(house):
+                group.available_count -= 1
+                group.available_price_sum -= price
+        if buyer_id is not None:
+            self._owners.add(buyer_id)
+
+        if self.record_events:
+            quality = house.quality_score.value if house.quality_score is not None else None
+            self.events.append(MarketEvent(self.step, house.id, buyer_id, price, house.bedrooms, quality))
+
+        if self._segmentTrees is not None:
+            position = self._positions[id(house)]
+            for tree in self._segmentTrees.values():
+                tree.remove(position)
+
+    def _house_changed(self, house: House, name: str, old: Any) -> None:
+        #Direct Write to a House of This Market (House.__setattr__, HouseView setters)
+        if name == "available":
+            if old and not house.available:
+                #Sold Without a Known Buyer
+                self._house_sold(house)
+            elif not self._stale:
+                #Back on the Market
+                for group in self._groups(house):
+                    group.available_count += 1
+                    group.available_price_sum += house.price
+                self._segmentTrees = None
+            return
+
+        #Price, Bedrooms or Quality Moved the House Between Groups/Indexes
+        self._stale = True
+        self._segmentTrees = None
+
+    def _build_segment_trees(self) -> Dict[str, Any]:
+        #Keys are prices of available candidates (+inf otherwise), in market order
+        prices = np.array([house.price for house in self.houses], dtype=float)
+        available = np.array([house.available for house in self.houses], dtype=bool)
+
+        fancy = np.array([house.is_new_construction() and house.quality_score == QualityScore.EXCELLENT
+                          for house in self.houses], dtype=bool)
+        avgPrice = self.calculate_average_price()
+        belowAverage = prices < avgPrice if avgPrice is not None else np.zeros(len(prices), dtype=bool)
+        pricePerSquareFoot = np.array([house.calculate_price_per_square_foot() for house in self.houses],
+                                      dtype=float)
+        pricePerSquareFoot[np.isnan(pricePerSquareFoot)] = np.inf
+
+        return {
+            "FANCY": FirstFitTree(np.where(available & fancy, prices, np.inf)),
+            "AVERAGE": FirstFitTree(np.where(available & belowAverage, prices, np.inf)),
+            "OPTIMIZER": FirstFitPairTree(np.where(available, prices, np.inf), pricePerSquareFoot)
+        }
+
+    def first_suitable_house(self, segment: Any, savings: float, annual_income: float) -> Optional[House]:
+        #First available house (market order) a consumer of this segment wants and can pay
+        self._fresh()
+        if self._segmentTrees is None:
+            self._segmentTrees = self._build_segment_trees()
+
+        if segment.name == "OPTIMIZER":
+            position = self._segmentTrees["OPTIMIZER"].first_matching(savings, annual_income / 12)
+        elif segment.name in self._segmentTrees:
+            position = self._segmentTrees[segment.name].first_at_most(savings)
+        else:
+            position = -1
+
+        return self.houses[position] if position >= 0 else None
+
+    def _statistics(self, bedrooms: Optional[int] = None,
+                    quality: Optional[QualityScore] = None) -> Optional[MarketStatistics]:
+        self._fresh()
+        if bedrooms is not None and quality is not None:
+            raise ValueError("Oops!  Filter by bedrooms or by quality, not both.  Try again...")
+        if bedrooms is not None:
+            return self._stats.get(("bedrooms", bedrooms))
+        if quality is not None:
+            return self._stats.get(("quality", quality.value))
+        return self._stats[("all", None)]
+
+    def count_available_houses(self, bedrooms: Optional[int] = None,
+                               quality: Optional[QualityScore] = None) -> int:
+        statistics = self._statistics(bedrooms, quality)
+        return statistics.available_count if statistics is not None else 0
+
+    def calculate_availability_rate(self) -> float:
+        statistics = self._statistics()
+        return statistics.available_count / statistics.count if statistics.count else 0
+
+    def calculate_average_available_price(self, bedrooms: Optional[int] = None,
+                                          quality: Optional[QualityScore] = None) -> Optional[float]:
+        statistics = self._statistics(bedrooms, quality)
+        if statistics is None or not statistics.available_count:
+            return None
+        return statistics.available_price_sum / statistics.available_count
+
+    def _owner_added(self, house: House, buyer_id: int) -> None:
+        #Consumer.house Assignment: an Available House is Sold to the Consumer
+        if house.available:
+            house.sell_house(buyer_id)
+        else:
+            self._owners.add(buyer_id)
+
+    def _owner_removed(self, buyer_id: int) -> None:
+        self._owners.discard(buyer_id)
+
+    def count_owners(self) -> int:
+        #Owners Seen Through Sales and Consumer.house (O(1))
+        return len(self._owners)
+
+  #Event Log
+    def replay(self, events: List[MarketEvent]) -> None:
+        #Re-apply Sales (e.g. on a fresh market built from the same data)
+        for event in events:
+            house = self._housesById.get(event.house_id)
+            if house is None:
+                raise ValueError(f"Oops!  {event.house_id} was no valid ID.  Try again...")
+            self.step = event.step
+            house.sell_house(event.buyer_id)
+
+    def events_to_frame(self) -> pl.DataFrame:
+        schema = {"step": pl.Int64, "house_id": pl.Int64, "buyer_id": pl.Int64,
+                  "price": pl.Float64, "bedrooms": pl.Int64, "quality": pl.Int64}
+        return pl.DataFrame([asdict(event) for event in self.events], schema=schema)
+
+    def availability_time_series(self) -> pl.DataFrame:
+        #Sales and Availability After Each Step, From the Log Alone
+        statistics = self._statistics()
+        initialAvailable = statistics.available_count + len(self.events)
+
+        return (
+            self.events_to_frame()
+            .group_by("step")
+            .agg(pl.len().cast(pl.Int64).alias("sales"), pl.col("price").sum().alias("sales_value"))
+            .sort("step")
+            .with_columns((initialAvailable - pl.col("sales").cum_sum()).alias("available_houses"))
+            .with_columns((pl.col("available_houses") / max(statistics.count, 1)).alias("availability_rate"))
+        )
 
   #1
     def get_house_by_id(self,
                         house_id: int) -> House:
-        for house in self.houses:
-            if house.id == house_id:
-                return house
+        house = self._housesById.get(house_id)
+        if house is not None:
+            return house
 
         return (f"Oops!  {house_id} was no valid ID.  Try again...")
 
   #2
     def calculate_average_price(self,
                                 bedrooms: Optional[int] = None) -> float:
-        filteredHouses = [
-            house for house in self.houses
-            if bedrooms is None
-            or house.bedrooms == bedrooms
-            ]
-
-        if not filteredHouses:
+        statistics = self._statistics(bedrooms)
+        if statistics is None or not statistics.count:
             return None
 
-        totalPrice = sum(house.price for house in filteredHouses)
-        avgPrice = totalPrice / len(filteredHouses)
+        avgPrice = statistics.price_sum / statistics.count
 
         return avgPrice
 
@@ -44,11 +279,12 @@ class HousingMarket:
     def get_houses_that_meet_requirements(self,
                                           max_price: int,
                                           segment: str) -> Optional[List[House]]:
-        filteredHouses = [
-            house for house in self.houses
-            if house.price <= max_price
-            and house.quality_score.value == segment.value
-            ]
+        self._fresh()
+        prices, positions = self._qualityIndex.get(segment.value, ([], []))
+
+        #Price Prefix (binary search), Back to Market Order
+        matching = sorted(positions[:bisect_right(prices, max_price)])
+        filteredHouses = [self.houses[position] for position in matching]
 
         if not filteredHouses:
             return None
@@ -1,6 +1,17 @@
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from real_estate_toolkit.agent_based_model.house_market import HousingMarket
+
+CURRENT_YEAR = datetime.now().year
+
+#Inputs of the Cached Derived Attributes
+DERIVED_INPUTS = frozenset(("price", "area", "year_built"))
+#Inputs of HousingMarket's Running Aggregates and Indexes
+MARKET_INPUTS = frozenset(("price", "bedrooms", "quality_score", "available"))
 
 class QualityScore(Enum):
     EXCELLENT = 5
@@ -9,7 +20,7 @@ class QualityScore(Enum):
     FAIR = 2
     POOR = 1
 
-@dataclass
+@dataclass(slots=True)
 class House:
     id: int
     price: float
@@ -18,27 +29,53 @@ class House:
     year_built: int
     quality_score: Optional[QualityScore]
     available: bool = True
+    market: Optional["HousingMarket"] = field(default=None, repr=False, compare=False)
+    #(price per sqft, age, new construction), None until first use
+    _derived: Optional[Tuple[Optional[float], int, bool]] = field(default=None, init=False,
+                                                                  repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        market = getattr(self, "market", None)
+        old = getattr(self, name, None)
+        object.__setattr__(self, name, value)
+        #Invalidate Derived Attributes
+        if name in DERIVED_INPUTS:
+            object.__setattr__(self, "_derived", None)
+        #Keep the Market in Step With Direct Writes (e.g. house.available = False)
+        if market is not None and name in MARKET_INPUTS and old != value:
+            market._house_changed(self, name, old)
+
+    def _set_available(self, available: bool) -> None:
+        #Raw Write for the Market (bypasses the change hook)
+        object.__setattr__(self, "available", available)
+
+    def _derive(self) -> Tuple[Optional[float], int, bool]:
+        if self._derived is None:
+            pricePerSquareFoot = None if self.area == 0 else round(self.price / self.area, 2)
+            age = CURRENT_YEAR - self.year_built
+            self._derived = (pricePerSquareFoot, age, age < 5)
+        return self._derived
+
+    @property
+    def age(self) -> int:
+        return self._derive()[1]
 
 #1
     def calculate_price_per_square_foot(self) -> float:
-        if self.area == 0:
-            pricePerSquareFoot = None
-        else:
-            pricePerSquareFoot = round(self.price / self.area, 2)
-        return pricePerSquareFoot
+        return self._derive()[0]
 
 #2
-    from datetime import datetime
-    def is_new_construction(self, current_year: int = datetime.now().year) -> bool:
+    def is_new_construction(self, current_year: int = CURRENT_YEAR) -> bool:
+        if current_year == CURRENT_YEAR:
+            return self._derive()[2]
+
         newConstruction = (current_year - self.year_built) < 5
         return newConstruction
 
 #3
     def get_quality_score(self) -> None:
-        from datetime import datetime
-
         if self.quality_score is None:
-            age = datetime.now().year - self.year_built
+            age = self.age
             if age < 0 and self.area > 0 and self.bedrooms >= 0:
                 self.quality_score = QualityScore.EXCELLENT
             elif age < 0 and self.area > 0 and self.bedrooms >= 0:
@@ -51,5 +88,9 @@ class House:
                 self.quality_score = QualityScore.POOR
 
 #4
-    def sell_house(self) -> None:
-        self.available = False
+    def sell_house(self, buyer_id: Optional[int] = None) -> None:
+        #On a Market: it Marks the House Sold and Records the Sale Event
+        if self.market is None:
+            self.available = False
+        elif self.available:
+            self.market._house_sold(self, buyer_id)
@@ -0,0 +1,292 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
+from math import erf, sqrt, ceil
+import numpy as np
+from real_estate_toolkit.agent_based_model.houses import House, QualityScore, CURRENT_YEAR, DERIVED_INPUTS, MARKET_INPUTS
+from real_estate_toolkit.agent_based_model.consumers import Consumer, Segment
+from real_estate_toolkit.data.dataset import ColumnarDataset
+
+if TYPE_CHECKING:
+    from real_estate_toolkit.agent_based_model.simulation import AnnualIncomeStatistics, ChildrenRange
+
+SEGMENTS: List[Segment] = list(Segment)
+#Truncated-Normal Rejection Sampling: Draws per Batch, Lowest Usable Acceptance Rate
+MAX_BATCH = 1 << 20
+MIN_ACCEPTANCE = 1e-6
+
+def _column(name: str, cast):
+    #Property Reading/Writing One Cell of a Table Column
+    def getter(self):
+        return cast(getattr(self.table, name)[self.row])
+
+    def setter(self, value):
+        #Keep the Market in Step (same hook as House.__setattr__)
+        market = getattr(self, "market", None) if name in MARKET_INPUTS else None
+        old = getter(self) if market is not None else None
+        getattr(self.table, name)[self.row] = value
+        if name in DERIVED_INPUTS:
+            self.table.invalidate_derived()
+        if market is not None and old != getter(self):
+            market._house_changed(self, name, old)
+
+    return property(getter, setter)
+
+def sample_truncated_normal(rng: np.random.Generator, size: int, mean: float, standard_deviation: float,
+                            minimum: float, maximum: float) -> np.ndarray:
+    if standard_deviation <= 0:
+        if not minimum <= mean <= maximum:
+            raise ValueError(f"Oops!  {mean} is outside [{minimum}, {maximum}].  Try again...")
+        return np.full(size, float(mean))
+
+    #Acceptance Probability Sizes Each Batch of Draws (capped, so a narrow window loops instead)
+    scale = standard_deviation * sqrt(2)
+    acceptance = 0.5 * (erf((maximum - mean) / scale) - erf((minimum - mean) / scale))
+    if acceptance < MIN_ACCEPTANCE:
+        raise ValueError(f"Oops!  [{minimum}, {maximum}] has almost no probability mass "
+                         f"({acceptance:.2e}).  Try again...")
+
+    samples = np.empty(size)
+    filled = 0
+    while filled < size:
+        remaining = size - filled
+        draws = rng.normal(mean, standard_deviation, min(ceil(remaining / acceptance * 1.05) + 16, MAX_BATCH))
+        accepted = draws[(draws >= minimum) & (draws <= maximum)][:remaining]
+        samples[filled:filled + len(accepted)] = accepted
+        filled += len(accepted)
+
+    return samples
+
+@dataclass
+class HouseTable:
+    id: np.ndarray
+    price: np.ndarray
+    area: np.ndarray
+    bedrooms: np.ndarray
+    year_built: np.ndarray
+    quality: np.ndarray
+    available: np.ndarray
+    _views: Optional[List["HouseView"]] = field(default=None, init=False, repr=False, compare=False)
+    _derived: Optional[Dict[str, np.ndarray]] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_houses(cls, houses: List[House]) -> "HouseTable":
+        return cls(
+            id=np.array([house.id for house in houses], dtype=np.int64),
+            price=np.array([house.price for house in houses], dtype=float),
+            area=np.array([house.area for house in houses], dtype=float),
+            bedrooms=np.array([house.bedrooms for house in houses], dtype=np.int64),
+            year_built=np.array([house.year_built for house in houses], dtype=np.int64),
+            quality=np.array([0 if house.quality_score is None else house.quality_score.value
+                              for house in houses], dtype=np.int8),
+            available=np.array([house.available for house in houses], dtype=bool)
+        )
+
+    @classmethod
+    def from_records(cls, data: Union[List[Dict[str, Any]], ColumnarDataset]) -> "HouseTable":
+        #Same Mapping as Simulation.create_housing_market
+        if isinstance(data, ColumnarDataset):
+            column = data.column
+        else:
+            column = lambda key: np.array([row[key] for row in data])
+
+        quality = np.clip(column("overall_qual").astype(np.int64) // 2, 1, 5)
+        return cls(
+            id=column("id").astype(np.int64),
+            price=column("sale_price").astype(float),
+            area=column("gr_liv_area").astype(float),
+            bedrooms=column("bedroom_abv_gr").astype(np.int64),
+            year_built=column("year_built").astype(np.int64),
+            quality=quality.astype(np.int8),
+            available=np.ones(len(quality), dtype=bool)
+        )
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def derived(self) -> Dict[str, np.ndarray]:
+        #Price per sqft (NaN for zero area, same rounding as House), age, new construction
+        if self._derived is None:
+            pricePerSquareFoot = np.array([round(price / area, 2) if area != 0 else np.nan
+                                           for price, area in zip(self.price.tolist(), self.area.tolist())],
+                                          dtype=float)
+            age = CURRENT_YEAR - self.year_built
+            self._derived = {"price_per_square_foot": pricePerSquareFoot, "age": age, "new_construction": age < 5}
+        return self._derived
+
+    def invalidate_derived(self) -> None:
+        self._derived = None
+
+    def views(self) -> List["HouseView"]:
+        if self._views is None:
+            self._views = [HouseView(self, row) for row in range(len(self))]
+        return self._views
+
+class HouseView:
+    #House API over one row of a HouseTable
+    __slots__ = ("table", "row", "market")
+
+    def __init__(self, table: HouseTable, row: int):
+        self.table = table
+        self.row = row
+        self.market = None
+
+    id = _column("id", int)
+    price = _column("price", float)
+    area = _column("area", float)
+    bedrooms = _column("bedrooms", int)
+    year_built = _column("year_built", int)
+    available = _column("available", bool)
+
+    @property
+    def quality_score(self) -> Optional[QualityScore]:
+        quality = int(self.table.quality[self.row])
+        return QualityScore(quality) if quality else None
+
+    @quality_score.setter
+    def quality_score(self, value: Optional[QualityScore]) -> None:
+        old = self.quality_score
+        self.table.quality[self.row] = 0 if value is None else value.value
+        if self.market is not None and old != value:
+            self.market._house_changed(self, "quality_score", old)
+
+    def _set_available(self, available: bool) -> None:
+        self.table.available[self.row] = available
+
+    @property
+    def age(self) -> int:
+        return int(self.table.derived()["age"][self.row])
+
+    def calculate_price_per_square_foot(self) -> Optional[float]:
+        pricePerSquareFoot = float(self.table.derived()["price_per_square_foot"][self.row])
+        return None if np.isnan(pricePerSquareFoot) else pricePerSquareFoot
+
+    def is_new_construction(self, current_year: int = CURRENT_YEAR) -> bool:
+        if current_year == CURRENT_YEAR:
+            return bool(self.table.derived()["new_construction"][self.row])
+        return (current_year - self.year_built) < 5
+
+    def get_quality_score(self) -> None:
+        #House.get_quality_score's Branches Reduce to EXCELLENT or POOR
+        if self.quality_score is None:
+            excellent = self.age < 0 and self.area > 0 and self.bedrooms >= 0
+            self.quality_score = QualityScore.EXCELLENT if excellent else QualityScore.POOR
+
+    def sell_house(self, buyer_id: Optional[int] = None) -> None:
+        #On a Market: it Marks the Row Sold and Records the Sale Event
+        if self.market is None:
+            self.available = False
+        elif self.available:
+            self.market._house_sold(self, buyer_id)
+
+    def __repr__(self) -> str:
+        return (f"HouseView(id={self.id}, price={self.price}, area={self.area}, bedrooms={self.bedrooms}, "
+                f"year_built={self.year_built}, quality_score={self.quality_score}, available={self.available})")
+
+@dataclass
+class ConsumerTable:
+    id: np.ndarray
+    annual_income: np.ndarray
+    children_number: np.ndarray
+    segment: np.ndarray
+    savings: np.ndarray
+    saving_rate: np.ndarray
+    interest_rate: np.ndarray
+    house: np.ndarray
+    house_views: List[HouseView] = field(default_factory=list, repr=False, compare=False)
+    _views: Optional[List["ConsumerView"]] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_consumers(cls, consumers: List[Consumer],
+                       house_views: Optional[List[HouseView]] = None) -> "ConsumerTable":
+        return cls(
+            id=np.array([consumer.id for consumer in consumers], dtype=np.int64),
+            annual_income=np.array([consumer.annual_income for consumer in consumers], dtype=float),
+            children_number=np.array([consumer.children_number for consumer in consumers], dtype=np.int64),
+            segment=np.array([SEGMENTS.index(consumer.segment) for consumer in consumers], dtype=np.int8),
+            savings=np.array([consumer.savings for consumer in consumers], dtype=float),
+            saving_rate=np.array([consumer.saving_rate for consumer in consumers], dtype=float),
+            interest_rate=np.array([consumer.interest_rate for consumer in consumers], dtype=float),
+            house=np.full(len(consumers), -1, dtype=np.int64),
+            house_views=house_views or []
+        )
+
+    @classmethod
+    def generate(cls, consumers_number: int,
+                 annual_income: "AnnualIncomeStatistics",
+                 children_range: "ChildrenRange",
+                 rng: np.random.Generator,
+                 saving_rate: float = 0.3,
+                 interest_rate: float = 0.05,
+                 house_views: Optional[List[HouseView]] = None) -> "ConsumerTable":
+        #Whole Population in One Shot (reproducible for a seeded rng)
+        return cls(
+            id=np.arange(consumers_number, dtype=np.int64),
+            annual_income=sample_truncated_normal(rng, consumers_number, annual_income.average,
+                                                  annual_income.standard_deviation,
+                                                  annual_income.minimum, annual_income.maximum),
+            children_number=rng.integers(int(children_range.minimum), int(children_range.maximum),
+                                         size=consumers_number, endpoint=True),
+            segment=rng.integers(0, len(SEGMENTS), size=consumers_number).astype(np.int8),
+            savings=np.zeros(consumers_number),
+            saving_rate=np.full(consumers_number, saving_rate),
+            interest_rate=np.full(consumers_number, interest_rate),
+            house=np.full(consumers_number, -1, dtype=np.int64),
+            house_views=house_views or []
+        )
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def views(self) -> List["ConsumerView"]:
+        if self._views is None:
+            self._views = [ConsumerView(self, row) for row in range(len(self))]
+        return self._views
+
+class ConsumerView:
+    #Consumer API over one row of a ConsumerTable
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: ConsumerTable, row: int):
+        self.table = table
+        self.row = row
+
+    id = _column("id", int)
+    annual_income = _column("annual_income", float)
+    children_number = _column("children_number", int)
+    savings = _column("savings", float)
+    saving_rate = _column("saving_rate", float)
+    interest_rate = _column("interest_rate", float)
+
+    @property
+    def segment(self) -> Segment:
+        return SEGMENTS[self.table.segment[self.row]]
+
+    @segment.setter
+    def segment(self, value: Segment) -> None:
+        self.table.segment[self.row] = SEGMENTS.index(value)
+
+    @property
+    def house(self) -> Optional[HouseView]:
+        houseRow = self.table.house[self.row]
+        return None if houseRow < 0 else self.table.house_views[houseRow]
+
+    @house.setter
+    def house(self, value: Optional[HouseView]) -> None:
+        if value is not None and not (isinstance(value, HouseView) and value.table.views() is self.table.house_views):
+            raise ValueError(f"Oops!  {value} is not a house of this market.  Try again...")
+
+        #Same Market Routing as Consumer.__setattr__
+        previous = self.house
+        if previous is not None and previous is not value and previous.market is not None:
+            previous.market._owner_removed(self.id)
+        if value is not None and value.market is not None:
+            value.market._owner_added(value, self.id)
+        self.table.house[self.row] = -1 if value is None else value.row
+
+    compute_savings = Consumer.compute_savings
+    buy_a_house = Consumer.buy_a_house
+
+    def __repr__(self) -> str:
+        return (f"ConsumerView(id={self.id}, annual_income={self.annual_income}, "
+                f"children_number={self.children_number}, segment={self.segment}, "
+                f"savings={self.savings}, house={self.house})")
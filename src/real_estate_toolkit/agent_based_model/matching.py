@@ -0,0 +1,89 @@
+from typing import Sequence
+import numpy as np
+
+class FirstFitTree:
+    #Min segment tree over market positions: "first position whose key is at
+    #most x" and "remove position" are both O(log n). Removed keys are +inf.
+    def __init__(self, keys: Sequence[float]):
+        keys = np.asarray(keys, dtype=float)
+        self.size = 1 << max(0, (len(keys) - 1).bit_length())
+
+        tree = np.full(2 * self.size, np.inf)
+        tree[self.size:self.size + len(keys)] = keys
+        #Build Bottom-Up, One Vectorized Level at a Time
+        low = self.size // 2
+        while low >= 1:
+            tree[low:2 * low] = np.minimum(tree[2 * low:4 * low:2], tree[2 * low + 1:4 * low:2])
+            low //= 2
+
+        #Python Floats (scalar access on lists is much faster than on arrays)
+        self.tree = tree.tolist()
+
+    def first_at_most(self, value: float) -> int:
+        tree = self.tree
+        if not tree[1] <= value:
+            return -1
+
+        node = 1
+        while node < self.size:
+            node = 2 * node if tree[2 * node] <= value else 2 * node + 1
+        return node - self.size
+
+    def remove(self, position: int) -> None:
+        tree = self.tree
+        node = position + self.size
+        tree[node] = np.inf
+        node //= 2
+        while node:
+            lowest = min(tree[2 * node], tree[2 * node + 1])
+            if tree[node] == lowest:
+                break
+            tree[node] = lowest
+            node //= 2
+
+def match_first_fit(savings: Sequence[float],
+                    prices: Sequence[float],
+                    available: Sequence[bool],
+                    down_payment_percentage: float) -> np.ndarray:
+    #Consumers in order take the first available house (market order) whose
+    #down payment fits their savings; same allocation as the nested loop.
+    thresholds = down_payment_percentage * np.asarray(prices, dtype=float)
+    keys = np.where(np.asarray(available, dtype=bool), thresholds, np.inf)
+    tree = FirstFitTree(keys)
+
+    matches = np.full(len(savings), -1, dtype=np.int64)
+    for index, consumerSavings in enumerate(savings):
+        position = tree.first_at_most(consumerSavings)
+        if position >= 0:
+            matches[index] = position
+            tree.remove(position)
+
+    return matches
+
+class FirstFitPairTree:
+    #Two-key variant: first position with primary <= x and secondary < y.
+    #Subtrees are pruned on both minima; exact, usually close to O(log n).
+    def __init__(self, primary: Sequence[float], secondary: Sequence[float]):
+        self.primary = FirstFitTree(primary)
+        self.secondary = FirstFitTree(secondary)
+        self.size = self.primary.size
+
+    def first_matching(self, primaryMax: float, secondaryBelow: float) -> int:
+        primaryTree, secondaryTree = self.primary.tree, self.secondary.tree
+
+        #Left-First Depth-First Search
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if not primaryTree[node] <= primaryMax or not secondaryTree[node] < secondaryBelow:
+                continue
+            if node >= self.size:
+                return node - self.size
+            stack.append(2 * node + 1)
+            stack.append(2 * node)
+
+        return -1
+
+    def remove(self, position: int) -> None:
+        self.primary.remove(position)
+        self.secondary.remove(position)
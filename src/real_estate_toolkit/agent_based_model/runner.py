@@ -0,0 +1,125 @@
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import numpy as np
+import polars as pl
+from .simulation import Simulation, CleaningMarketMechanism, AnnualIncomeStatistics, ChildrenRange
+
+@dataclass(frozen=True)
+class Scenario:
+    saving_rate: float = 0.3
+    interest_rate: float = 0.05
+    down_payment_percentage: float = 0.2
+
+@dataclass
+class ScenarioResult:
+    scenario: Scenario
+    seeds: List[int]
+    #Shape (seeds, years)
+    owners_rate: np.ndarray
+    availability_rate: np.ndarray
+
+    @property
+    def owners_rate_mean(self) -> np.ndarray:
+        return self.owners_rate.mean(axis=0)
+
+    @property
+    def owners_rate_std(self) -> np.ndarray:
+        return self.owners_rate.std(axis=0)
+
+    @property
+    def availability_rate_mean(self) -> np.ndarray:
+        return self.availability_rate.mean(axis=0)
+
+    @property
+    def availability_rate_std(self) -> np.ndarray:
+        return self.availability_rate.std(axis=0)
+
+#Per-Process Market Data (sent once per worker, not once per task)
+_workerData: Any = None
+
+def _init_worker(housing_market_data: Any) -> None:
+    global _workerData
+    _workerData = housing_market_data
+
+def _run_one(settings: Dict[str, Any], scenario: Scenario, seed: int,
+             compound_interest: bool) -> Tuple[List[float], List[float]]:
+    simulation = Simulation(housing_market_data=_workerData, seed=seed, **settings, **asdict(scenario))
+    timeSeries = simulation.run(compound_interest=compound_interest)
+    return timeSeries["owners_rate"], timeSeries["availability_rate"]
+
+@dataclass
+class SimulationRunner:
+    housing_market_data: Any
+    consumers_number: int
+    years: int
+    annual_income: AnnualIncomeStatistics
+    children_range: ChildrenRange
+    cleaning_market_mechanism: CleaningMarketMechanism
+    array_backed: bool = True
+    max_workers: Optional[int] = None
+    #Interest only affects savings when compounded (see Simulation.run)
+    compound_interest: bool = True
+
+    def _settings(self) -> Dict[str, Any]:
+        return {
+            "consumers_number": self.consumers_number,
+            "years": self.years,
+            "annual_income": self.annual_income,
+            "children_range": self.children_range,
+            "cleaning_market_mechanism": self.cleaning_market_mechanism,
+            "array_backed": self.array_backed
+        }
+
+    def run(self, scenarios: Sequence[Scenario], seeds: Sequence[int]) -> List[ScenarioResult]:
+        settings = self._settings()
+        tasks = [(scenario, seed) for scenario in scenarios for seed in seeds]
+
+        #In-Process for a Single Worker, Process Pool Otherwise
+        if self.max_workers == 1:
+            _init_worker(self.housing_market_data)
+            outputs = [_run_one(settings, scenario, seed, self.compound_interest) for scenario, seed in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                     initargs=(self.housing_market_data,)) as executor:
+                futures = [executor.submit(_run_one, settings, scenario, seed, self.compound_interest)
+                           for scenario, seed in tasks]
+                outputs = [future.result() for future in futures]
+
+        results = []
+        for i, scenario in enumerate(scenarios):
+            scenarioOutputs = outputs[i * len(seeds):(i + 1) * len(seeds)]
+            results.append(ScenarioResult(
+                scenario=scenario,
+                seeds=list(seeds),
+                owners_rate=np.array([owners for owners, _ in scenarioOutputs]),
+                availability_rate=np.array([availability for _, availability in scenarioOutputs])
+            ))
+
+        return results
+
+    def sensitivity_sweep(self,
+                          seeds: Sequence[int],
+                          saving_rates: Sequence[float] = (0.3,),
+                          interest_rates: Sequence[float] = (0.05,),
+                          down_payment_percentages: Sequence[float] = (0.2,)) -> List[ScenarioResult]:
+        scenarios = [Scenario(savingRate, interestRate, downPayment)
+                     for savingRate, interestRate, downPayment
+                     in product(saving_rates, interest_rates, down_payment_percentages)]
+        return self.run(scenarios, seeds)
+
+def results_to_frame(results: Sequence[ScenarioResult]) -> pl.DataFrame:
+    #Long Format: one row per scenario and year
+    rows = []
+    for result in results:
+        for year in range(result.owners_rate.shape[1]):
+            rows.append({
+                **asdict(result.scenario),
+                "year": year + 1,
+                "owners_rate_mean": float(result.owners_rate_mean[year]),
+                "owners_rate_std": float(result.owners_rate_std[year]),
+                "availability_rate_mean": float(result.availability_rate_mean[year]),
+                "availability_rate_std": float(result.availability_rate_std[year])
+            })
+    return pl.DataFrame(rows)
@@ -0,0 +1,58 @@
+from typing import Union
+import numpy as np
+
+ArrayLike = Union[float, np.ndarray]
+
+def _per_consumer_year(values: ArrayLike, consumers: int, years: int) -> np.ndarray:
+    #Scalar -> Everyone, 1-D -> Per Consumer, 2-D -> Per Consumer and Year
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        if len(values) != consumers:
+            raise ValueError(f"Oops!  {len(values)} values for {consumers} consumers.  Try again...")
+        values = values[:, None]
+    return np.broadcast_to(values, (consumers, years)) if values.ndim == 2 else np.full((consumers, years), values)
+
+def project_savings(initial_savings: ArrayLike,
+                    annual_income: ArrayLike,
+                    saving_rate: ArrayLike,
+                    interest_rate: ArrayLike,
+                    years: int) -> np.ndarray:
+    #Same recursion as Consumer.compute_savings, s <- (s + income * saving_rate) * (1 + interest),
+    #for a whole population. Returns (consumers, years + 1); column 0 is the initial savings.
+    initial = np.atleast_1d(np.asarray(initial_savings, dtype=float))
+    consumers = max(len(initial), *(np.atleast_1d(np.asarray(values)).shape[0]
+                                    for values in (annual_income, saving_rate, interest_rate)))
+    initial = np.broadcast_to(initial, (consumers,))
+
+    if years < 0:
+        raise ValueError(f"Oops!  {years} was no valid number of years.  Try again...")
+    if years == 0:
+        return initial[:, None].copy()
+
+    constant = all(np.asarray(values).ndim <= 1 for values in (annual_income, saving_rate, interest_rate))
+
+    #Constant Rates: Closed-Form Annuity
+    if constant:
+        contribution = (_per_consumer_year(annual_income, consumers, 1)
+                        * _per_consumer_year(saving_rate, consumers, 1))
+        growth = 1 + _per_consumer_year(interest_rate, consumers, 1)
+        periods = np.arange(years + 1)
+        compounded = growth ** periods
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            annuity = np.where(growth == 1,
+                               periods,
+                               growth * (compounded - 1) / (growth - 1))
+        return initial[:, None] * compounded + contribution * annuity
+
+    #Varying Rates: s_t = G_t * (s_0 + sum_j c_j / G_{j-1})
+    contribution = (_per_consumer_year(annual_income, consumers, years)
+                    * _per_consumer_year(saving_rate, consumers, years))
+    growth = 1 + _per_consumer_year(interest_rate, consumers, years)
+    compounded = np.cumprod(growth, axis=1)
+    previous = np.hstack([np.ones((consumers, 1)), compounded[:, :-1]])
+
+    trajectory = np.empty((consumers, years + 1))
+    trajectory[:, 0] = initial
+    trajectory[:, 1:] = compounded * (initial[:, None] + np.cumsum(contribution / previous, axis=1))
+    return trajectory
@@ -1,10 +1,15 @@
 from enum import Enum, auto
 from dataclasses import dataclass
-from random import gauss, randint, choice
+from random import Random
+import random
 from typing import List, Dict, Any, Optional
+import numpy as np
 from .houses import House, QualityScore
 from .house_market import HousingMarket
 from .consumers import Segment, Consumer
+from .market_arrays import HouseTable, ConsumerTable
+from .matching import match_first_fit
+from .savings import project_savings
 
 class CleaningMarketMechanism(Enum):
     INCOME_ORDER_DESCENDANT = auto()
@@ -34,12 +39,24 @@ class Simulation:
     down_payment_percentage: float = 0.2
     saving_rate: float = 0.3
     interest_rate: float = 0.05
+    array_backed: bool = False
+    seed: Optional[int] = None
 
     def __post_init__(self):
+        #Own Seeded RNG, or the Global random Module
+        self.rng = Random(self.seed) if self.seed is not None else random
         self.housing_market: Optional[HousingMarket] = None
         self.consumers: List[Consumer] = []
+        self.house_table: Optional[HouseTable] = None
+        self.consumer_table: Optional[ConsumerTable] = None
 
     def create_housing_market(self):
+            #Array-Backed: NumPy Columns, Houses are Views
+            if self.array_backed:
+                self.house_table = HouseTable.from_records(self.housing_market_data)
+                self.housing_market = HousingMarket(self.house_table.views())
+                return
+
             houses = []
             for data in self.housing_market_data:
                 quality_score = QualityScore(max(1, min(5, int(data["overall_qual"]) // 2)))
@@ -56,14 +73,24 @@ class Simulation:
             self.housing_market = HousingMarket(houses)
 
     def create_consumers(self) -> None:
+        #Array-Backed: Batched NumPy Draws
+        if self.array_backed:
+            houseViews = self.house_table.views() if self.house_table is not None else []
+            self.consumer_table = ConsumerTable.generate(self.consumers_number, self.annual_income,
+                                                         self.children_range, np.random.default_rng(self.seed),
+                                                         self.saving_rate, self.interest_rate, houseViews)
+            self.consumers = list(self.consumer_table.views())
+            return
+
+        segments = list(Segment)
         for i in range(self.consumers_number):
             while True:
-                annual_income = gauss(self.annual_income.average, self.annual_income.standard_deviation)
+                annual_income = self.rng.gauss(self.annual_income.average, self.annual_income.standard_deviation)
                 if self.annual_income.minimum <= annual_income <= self.annual_income.maximum:
                     break
 
-            children_number = randint(self.children_range.minimum, self.children_range.maximum)
-            segment = choice(list(Segment))
+            children_number = self.rng.randint(self.children_range.minimum, self.children_range.maximum)
+            segment = self.rng.choice(segments)
             consumer = Consumer(
                 id=i,
                 annual_income=annual_income,
@@ -75,30 +102,122 @@ class Simulation:
             self.consumers.append(consumer)
 
     def compute_consumers_savings(self) -> None:
+        if self.consumer_table is not None:
+            self.consumer_table.savings += self.consumer_table.annual_income * self.consumer_table.saving_rate
+            return
+
         for consumer in self.consumers:
             consumer.savings += consumer.annual_income * consumer.saving_rate
 
+    def project_consumers_savings(self, years: Optional[int] = None,
+                                  compound_interest: bool = True) -> np.ndarray:
+        #(consumers, years + 1) trajectory, rows in self.consumers order
+        years = self.years if years is None else years
+
+        if self.consumer_table is not None:
+            rows = np.array([consumer.row for consumer in self.consumers], dtype=np.int64)
+            table = self.consumer_table
+            savings, income = table.savings[rows], table.annual_income[rows]
+            savingRate, interestRate = table.saving_rate[rows], table.interest_rate[rows]
+        else:
+            savings = np.array([consumer.savings for consumer in self.consumers], dtype=float)
+            income = np.array([consumer.annual_income for consumer in self.consumers], dtype=float)
+            savingRate = np.array([consumer.saving_rate for consumer in self.consumers], dtype=float)
+            interestRate = np.array([consumer.interest_rate for consumer in self.consumers], dtype=float)
+
+        if not compound_interest:
+            interestRate = np.zeros_like(interestRate)
+
+        return project_savings(savings, income, savingRate, interestRate, years)
+
+    def _clean_the_market_arrays(self) -> None:
+        consumerTable = self.consumer_table
+        houseTable = self.house_table
+        houseViews = houseTable.views()
+
+        #Order Rows (stable, like list.sort)
+        rows = np.array([consumer.row for consumer in self.consumers], dtype=np.int64)
+        if self.cleaning_market_mechanism == CleaningMarketMechanism.INCOME_ORDER_DESCENDANT:
+            rows = rows[np.argsort(-consumerTable.annual_income[rows], kind="stable")]
+        elif self.cleaning_market_mechanism == CleaningMarketMechanism.INCOME_ORDER_ASCENDANT:
+            rows = rows[np.argsort(consumerTable.annual_income[rows], kind="stable")]
+        elif self.cleaning_market_mechanism == CleaningMarketMechanism.RANDOM:
+            self.rng.shuffle(self.consumers)
+            rows = np.array([consumer.row for consumer in self.consumers], dtype=np.int64)
+
+        consumerViews = consumerTable.views()
+        self.consumers = [consumerViews[row] for row in rows]
+
+        #Owners Stay Out of the Market
+        rows = rows[consumerTable.house[rows] < 0]
+
+        #First Affordable Available House (O(log H) per consumer)
+        matches = match_first_fit(consumerTable.savings[rows].tolist(), houseTable.price,
+                                  houseTable.available, self.down_payment_percentage)
+        for row, houseRow in zip(rows[matches >= 0].tolist(), matches[matches >= 0].tolist()):
+            consumerTable.house[row] = houseRow
+            houseViews[houseRow].sell_house(int(consumerTable.id[row]))
+
     def clean_the_market(self) -> None:
+        if self.consumer_table is not None and self.house_table is not None:
+            self._clean_the_market_arrays()
+            return
+
         if self.cleaning_market_mechanism == CleaningMarketMechanism.INCOME_ORDER_DESCENDANT:
             self.consumers.sort(key=lambda c: c.annual_income, reverse=True)
         elif self.cleaning_market_mechanism == CleaningMarketMechanism.INCOME_ORDER_ASCENDANT:
             self.consumers.sort(key=lambda c: c.annual_income)
         elif self.cleaning_market_mechanism == CleaningMarketMechanism.RANDOM:
-            from random import shuffle
-            shuffle(self.consumers)
+            self.rng.shuffle(self.consumers)
 
-        for consumer in self.consumers:
-            for house in self.housing_market.houses:
-                if house.available and consumer.savings >= self.down_payment_percentage * house.price:
-                    consumer.house = house
-                    house.available = False
-                    break
+        #Owners Stay Out of the Market
+        buyers = [consumer for consumer in self.consumers if consumer.house is None]
+
+        #First Affordable Available House (O(log H) per consumer)
+        houses = self.housing_market.houses
+        matches = match_first_fit([consumer.savings for consumer in buyers],
+                                  [house.price for house in houses],
+                                  [house.available for house in houses],
+                                  self.down_payment_percentage)
+        for consumer, position in zip(buyers, matches.tolist()):
+            if position >= 0:
+                consumer.house = houses[position]
+                houses[position].sell_house(consumer.id)
 
     def compute_owners_population_rate(self) -> float:
-        owners = sum(1 for consumer in self.consumers if consumer.house is not None)
-        return owners / len(self.consumers) if self.consumers else 0
+        #Market Counts Owners on Each Sale and consumer.house Assignment (O(1))
+        return self.housing_market.count_owners() / len(self.consumers) if self.consumers else 0
 
     def compute_houses_availability_rate(self) -> float:
-        available_houses = sum(1 for house in self.housing_market.houses if house.available)
-        total_houses = len(self.housing_market.houses)
-        return available_houses / total_houses if total_houses else 0
+        #Market Keeps Running Counts (O(1))
+        return self.housing_market.calculate_availability_rate()
+
+    def run(self, compound_interest: bool = False) -> Dict[str, List[float]]:
+        if self.housing_market is None:
+            self.create_housing_market()
+        if not self.consumers:
+            self.create_consumers()
+
+        #Savings Do Not Depend on the Market: Project All Years at Once
+        if compound_interest:
+            consumers = list(self.consumers)
+            trajectory = self.project_consumers_savings(self.years, compound_interest=True)
+
+        #One Market Step per Year
+        timeSeries = {"owners_rate": [], "availability_rate": []}
+        for year in range(self.years):
+            if not compound_interest:
+                self.compute_consumers_savings()
+            elif self.consumer_table is not None:
+                rows = np.array([consumer.row for consumer in consumers], dtype=np.int64)
+                self.consumer_table.savings[rows] = trajectory[:, year + 1]
+            else:
+                for consumer, savings in zip(consumers, trajectory[:, year + 1].tolist()):
+                    consumer.savings = savings
+
+            self.housing_market.step = year + 1
+            self.clean_the_market()
+            timeSeries["owners_rate"].append(self.compute_owners_population_rate())
+            timeSeries["availability_rate"].append(self.compute_houses_availability_rate())
+
+        return timeSeries
@@ -0,0 +1,158 @@
+from typing import List, Iterator, Optional, Tuple, Union
+import numpy as np
+import polars as pl
+
+METHODS = ("pearson", "spearman")
+
+class CorrelationAccumulator:
+    #Pairwise-complete Pearson correlations from one pass over row chunks.
+    #Per pair (i, j) it keeps, over the rows where both are non-null: the
+    #count, sum of x_i, sum of x_i ** 2 and sum of x_i * x_j (as p x p
+    #matrices filled block pair by block pair), so chunks and shards merge.
+    def __init__(self, columns: int, block_size: int = 64):
+        self.columns = columns
+        self.block_size = block_size
+        #Per-Column Shift (first chunk mean) Limits Cancellation in the Raw Sums
+        self.shift: Optional[np.ndarray] = None
+        self.counts = np.zeros((columns, columns))
+        self.sums = np.zeros((columns, columns))
+        self.squares = np.zeros((columns, columns))
+        self.products = np.zeros((columns, columns))
+
+    def _blocks(self) -> Iterator[Tuple[slice, slice]]:
+        #Upper-Triangular Block Pairs
+        starts = range(0, self.columns, self.block_size)
+        for first in starts:
+            for second in starts:
+                if second >= first:
+                    yield slice(first, first + self.block_size), slice(second, second + self.block_size)
+
+    def update(self, chunk: np.ndarray) -> None:
+        chunk = np.asarray(chunk, dtype=float)
+        if chunk.ndim != 2 or chunk.shape[1] != self.columns:
+            raise ValueError(f"Oops!  {chunk.shape} was no valid chunk shape.  Try again...")
+        if len(chunk) == 0:
+            return
+
+        valid = ~np.isnan(chunk)
+        if self.shift is None:
+            counts = valid.sum(axis=0)
+            self.shift = np.where(counts > 0, np.where(valid, chunk, 0.0).sum(axis=0) / np.maximum(counts, 1), 0.0)
+
+        mask = valid.astype(float)
+        values = np.where(valid, chunk - self.shift, 0.0)
+        squares = values * values
+
+        for a, b in self._blocks():
+            counts = mask[:, a].T @ mask[:, b]
+            products = values[:, a].T @ values[:, b]
+            self.counts[a, b] += counts
+            self.products[a, b] += products
+            self.sums[a, b] += values[:, a].T @ mask[:, b]
+            self.squares[a, b] += squares[:, a].T @ mask[:, b]
+            if a != b:
+                #Symmetric Blocks by Transpose, the Others Computed
+                self.counts[b, a] += counts.T
+                self.products[b, a] += products.T
+                self.sums[b, a] += values[:, b].T @ mask[:, a]
+                self.squares[b, a] += squares[:, b].T @ mask[:, a]
+
+    def merge(self, other: "CorrelationAccumulator") -> None:
+        if other.shift is None:
+            return
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        if not np.array_equal(self.shift, other.shift):
+            #Re-Center the Other's Sums on This Shift
+            delta = (other.shift - self.shift)[:, None]
+            otherSums = other.sums + delta * other.counts
+            otherSquares = other.squares + 2 * delta * other.sums + delta ** 2 * other.counts
+            otherProducts = (other.products + delta * other.sums.T + delta.T * other.sums
+                             + delta * delta.T * other.counts)
+        else:
+            otherSums, otherSquares, otherProducts = other.sums, other.squares, other.products
+
+        self.counts += other.counts
+        self.sums += otherSums
+        self.squares += otherSquares
+        self.products += otherProducts
+
+    def correlation(self) -> np.ndarray:
+        counts, products = self.counts, self.products
+        spread = counts * self.squares - self.sums ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matrix = (counts * products - self.sums * self.sums.T) / np.sqrt(spread * spread.T)
+        matrix[(counts < 2) | ~np.isfinite(matrix)] = np.nan
+        matrix = np.clip(matrix, -1.0, 1.0)
+
+        diagonal = np.diag(matrix).copy()
+        diagonal[np.isfinite(diagonal)] = 1.0
+        np.fill_diagonal(matrix, diagonal)
+        return matrix
+
+def _chunks(lf: pl.LazyFrame, chunk_size: int) -> Iterator[pl.DataFrame]:
+    #Streaming Engine (polars >= 1.32), One Collect Otherwise
+    if hasattr(lf, "collect_batches"):
+        yield from lf.collect_batches(chunk_size=chunk_size)
+    else:
+        yield from lf.collect().iter_slices(chunk_size)
+
+def correlation_matrix(data: Union[pl.DataFrame, pl.LazyFrame],
+                       columns: Optional[List[str]] = None,
+                       method: str = "pearson",
+                       chunk_size: int = 100_000,
+                       block_size: int = 64) -> Tuple[np.ndarray, List[str]]:
+    #(p x p matrix, column names); columns default to every numeric column
+    if method not in METHODS:
+        raise ValueError(f"Oops!  {method} was no valid method.  Try again...")
+
+    lf = data.lazy()
+    schema = lf.collect_schema()
+    if columns is None:
+        columns = [column for column, dtype in schema.items() if dtype.is_numeric()]
+
+    expressions = [pl.col(column).cast(pl.Float64).fill_nan(None) for column in columns]
+    if method == "spearman":
+        #Ranks Need Every Row: Spearman Collects the Columns (no streaming)
+        return _spearman(lf.select(expressions).collect(), block_size), columns
+
+    accumulator = CorrelationAccumulator(len(columns), block_size)
+    for chunk in _chunks(lf.select(expressions), chunk_size):
+        accumulator.update(chunk.to_numpy())
+
+    return accumulator.correlation(), columns
+
+def _spearman(frame: pl.DataFrame, block_size: int) -> np.ndarray:
+    #Pearson of (average) ranks over pairwise-complete rows, like pandas.
+    #Whole-column ranks are exact for pairs of null-free columns; pairs
+    #touching a column with nulls are re-ranked over the rows both have.
+    ranked = frame.select(pl.all().rank("average").cast(pl.Float64))
+    accumulator = CorrelationAccumulator(frame.width, block_size)
+    accumulator.update(ranked.to_numpy())
+    matrix = accumulator.correlation()
+
+    nullable = [i for i, series in enumerate(frame.iter_columns()) if series.null_count()]
+    for i in nullable:
+        for j in range(frame.width):
+            if j == i or (j in nullable and j < i):
+                continue
+            pair = frame.select(frame.columns[i], frame.columns[j]).drop_nulls()
+            pairAccumulator = CorrelationAccumulator(2)
+            pairAccumulator.update(pair.select(pl.all().rank("average").cast(pl.Float64)).to_numpy())
+            matrix[i, j] = matrix[j, i] = pairAccumulator.correlation()[0, 1]
+
+    return matrix
+
+def top_pairs(matrix: np.ndarray, columns: List[str], k: int = 10) -> pl.DataFrame:
+    #k Strongest Off-Diagonal Pairs by |r|
+    first, second = np.triu_indices(len(columns), 1)
+    values = matrix[first, second]
+    keep = np.isfinite(values)
+    first, second, values = first[keep], second[keep], values[keep]
+    order = np.argsort(-np.abs(values), kind="stable")[:k]
+
+    return pl.DataFrame({
+        "column_a": [columns[i] for i in first[order]],
+        "column_b": [columns[j] for j in second[order]],
+        "correlation": values[order]
+    }, schema={"column_a": pl.Utf8, "column_b": pl.Utf8, "correlation": pl.Float64})
@@ -1,37 +1,206 @@
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
+import numpy as np
 import polars as pl
+import pandas as pd
+import plotly
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
 import os
+from real_estate_toolkit.data.cache import scan_csv_cached, atomic_write
+from real_estate_toolkit.analytics import scalable_plots, correlation
+from real_estate_toolkit.analytics.incremental import IncrementalMarketStatistics
+
+OUTPUT_DIR = "src/real_estate_toolkit/analytics/outputs/"
+#Versioned Bundle Name: After a plotly Upgrade New Files Never Load the Old Bundle
+PLOTLY_BUNDLE = f"plotly-{plotly.__version__}.min.js"
 
 class MarketAnalyzer:
-    def __init__(self, data_path: str):
+    def __init__(self, data_path: str, use_cache: bool = True,
+                 output_dir: str = OUTPUT_DIR,
+                 write_outputs: bool = True,
+                 max_workers: Optional[int] = None,
+                 max_points: Optional[int] = 20_000,
+                 bins: int = 50,
+                 density: bool = True):
         self.data_path = data_path
-        self.real_state_data = pl.read_csv(data_path, null_values="NA")
-        self.real_state_clean_data = None
+        #Lazy Source: Each Report Reads Only the Columns it Projects
+        if use_cache:
+            self._source = scan_csv_cached(data_path, null_values="NA")
+        else:
+            self._source = pl.scan_csv(data_path, null_values="NA")
+        self._data: Optional[pl.DataFrame] = None
+        self._cleanPlan: Optional[pl.LazyFrame] = None
+        self._cleanData: Optional[pl.DataFrame] = None
+        self._height: Optional[int] = None
+        self._correlations: Dict[Tuple[Optional[Tuple[str, ...]], str], Tuple[np.ndarray, List[str]]] = {}
+        #Report Pipeline: False -> Stats Only, Figures Built on Request
+        self.output_dir = output_dir
+        self.write_outputs = write_outputs
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pandasColumns: Dict[str, pd.Series] = {}
+        self._builders: Dict[str, Callable[[], go.Figure]] = {}
+        self._figures: Dict[str, go.Figure] = {}
+        self._rendering: Dict[str, Future] = {}
+        #Above max_points Rows: Binned/Downsampled Figures (None -> never)
+        self.max_points = max_points
+        self.bins = bins
+        #Binned Scatters: Grid Density of All Rows Under the Sample
+        self.density = density
+
+  #Data (collected on first access)
+    @property
+    def real_state_data(self) -> pl.DataFrame:
+        if self._data is None:
+            self._data = self._source.collect()
+        return self._data
+
+    @property
+    def real_state_clean_data(self) -> Optional[pl.DataFrame]:
+        if self._cleanData is None and self._cleanPlan is not None:
+            self._cleanData = self._cleanPlan.collect()
+        return self._cleanData
+
+    @real_state_clean_data.setter
+    def real_state_clean_data(self, df: Optional[pl.DataFrame]) -> None:
+        self._cleanData = df
+        self._cleanPlan = df.lazy() if df is not None else None
+        self._height = None
+        self._pandasColumns = {}
+        self._correlations = {}
+
+    def _clean_lazy(self) -> pl.LazyFrame:
+        if self._cleanPlan is None:
+            raise ValueError("Cleaned data is not available. Please run clean_data() first.")
+        #Reuse Collected Data, Otherwise Push the Projection Down to the Scan
+        return self._cleanData.lazy() if self._cleanData is not None else self._cleanPlan
+
+  #Report Pipeline
+    def _scalable(self) -> bool:
+        if self.max_points is None:
+            return False
+        if self._height is None:
+            self._height = self._clean_lazy().select(pl.len()).collect().item()
+        return self._height > self.max_points
+
+    def _pandas(self, columns: List[str]) -> pd.DataFrame:
+        #Convert Each Column to pandas Once
+        missing = [column for column in columns if column not in self._pandasColumns]
+        if missing:
+            converted = self._clean_lazy().select(missing).collect().to_pandas()
+            for column in missing:
+                self._pandasColumns[column] = converted[column]
+
+        return pd.DataFrame({column: self._pandasColumns[column] for column in columns}, copy=False)
+
+    def _render(self, name: str, builder: Callable[[], go.Figure]) -> go.Figure:
+        fig = builder()
+        #Shared Bundle Next to the Files; Atomic Write (readers never see a partial file)
+        atomic_write(os.path.join(self.output_dir, f"{name}.html"),
+                     lambda tmpPath: fig.write_html(tmpPath, include_plotlyjs=PLOTLY_BUNDLE))
+        return fig
+
+    def _add_figure(self, name: str, builder: Callable[[], go.Figure]) -> None:
+        self._builders[name] = builder
+        self._figures.pop(name, None)
+        if not self.write_outputs:
+            return
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        #Write the Bundle Once, Before Any Worker Looks for It
+        bundlePath = os.path.join(self.output_dir, PLOTLY_BUNDLE)
+        if not os.path.exists(bundlePath):
+            atomic_write(bundlePath, lambda tmpPath: Path(tmpPath).write_text(get_plotlyjs(), encoding="utf-8"))
+
+        #Superseded Render: Cancel it, or Let it Finish Before the New One Starts
+        previous = self._rendering.pop(name, None)
+        if previous is not None and not previous.cancel():
+            previous.exception()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._rendering[name] = self._executor.submit(self._render, name, builder)
+
+    def figure(self, name: str) -> go.Figure:
+        if name in self._rendering:
+            self._figures[name] = self._rendering.pop(name).result()
+        if name not in self._figures:
+            if name not in self._builders:
+                raise ValueError(f"Oops!  {name} was no valid figure.  Try again...")
+            self._figures[name] = self._builders[name]()
+        return self._figures[name]
+
+    def wait_for_outputs(self) -> List[str]:
+        #Block Until Every Pending File is Written (re-raises worker errors), Release the Workers
+        try:
+            for name in list(self._rendering):
+                self.figure(name)
+        finally:
+            self.close()
+        return [os.path.join(self.output_dir, f"{name}.html") for name in self._builders] if self.write_outputs else []
+
+    def close(self) -> None:
+        #Shut the Worker Threads Down (a later figure starts a new pool)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def generate_report(self, variables: List[str], report_name: str = "market_report") -> Dict[str, Any]:
+        #Every Analysis, All Figures in One HTML File
+        statistics = {
+            "price_distribution": self.generate_price_distribution_analysis(),
+            "neighborhood_prices": self.neighborhood_price_comparison()
+        }
+        self.feature_correlation_heatmap(variables)
+        self.create_scatter_plots()
+
+        divs = [self.figure(name).to_html(full_html=False, include_plotlyjs=False) for name in self._builders]
+        reportPath = os.path.join(self.output_dir, f"{report_name}.html")
+
+        def write_report(tmpPath: str) -> None:
+            with open(tmpPath, "w", encoding="utf-8") as report:
+                report.write("<html>\n<head><meta charset=\"utf-8\" /></head>\n<body>\n")
+                report.write(f"<script type=\"text/javascript\">{get_plotlyjs()}</script>\n")
+                report.write("\n".join(divs))
+                report.write("\n</body>\n</html>\n")
+
+        atomic_write(reportPath, write_report)
+
+        statistics["report_path"] = reportPath
+        return statistics
+
+    def refresh_statistics(self, state_path: str) -> IncrementalMarketStatistics:
+        #Incremental Mode: Fold Rows Appended Since the Last Refresh, Persist
+        statistics = IncrementalMarketStatistics.load(state_path)
+        if statistics.refresh(self.data_path):
+            statistics.save()
+        return statistics
 
     def clean_data(self) -> None:
-        df = self.real_state_data
-
-        for column in df.columns:
-            if df[column].dtype == pl.Utf8:
-                df = df.with_columns([pl.col(column).cast(pl.Categorical)])
-            elif df[column].dtype == pl.Float64 or df[column].dtype == pl.Int64:
-                df = df.with_columns([pl.col(column).cast(pl.Float64)])
-
-        df = df.fill_null(strategy="mean")
-
-
-
-        self.real_state_clean_data = df
+        lf = self._source if self._data is None else self._data.lazy()
+
+        #One Expression per Column: Casts + Mean Fill (numeric columns only)
+        expressions = []
+        for column, dtype in lf.collect_schema().items():
+            if dtype == pl.Utf8:
+                expressions.append(pl.col(column).cast(pl.Categorical))
+            elif dtype.is_numeric():
+                expression = pl.col(column).cast(pl.Float64) if dtype == pl.Float64 or dtype == pl.Int64 else pl.col(column)
+                expressions.append(expression.fill_null(expression.mean()))
+
+        self._cleanPlan = lf.with_columns(expressions)
+        self._cleanData = None
+        self._height = None
+        self._pandasColumns = {}
+        self._correlations = {}
 
     def generate_price_distribution_analysis(self) -> pl.DataFrame:
-        if self.real_state_clean_data is None:
-            raise ValueError("Cleaned data is not available. Please run clean_data() first.")
-
-        df = self.real_state_clean_data
+        lf = self._clean_lazy()
 
-        price_statistics = df.select([
+        price_statistics = lf.select([
             pl.col("SalePrice").mean().alias("mean"),
             pl.col("SalePrice").median().alias("median"),
             pl.col("SalePrice").std().alias("std_dev"),
@@ -41,23 +210,23 @@ class MarketAnalyzer:
 
 
 
-        output_dir = "src/real_estate_toolkit/analytics/outputs/"
-        os.makedirs(output_dir, exist_ok=True)
-
-        fig = px.histogram(df.to_pandas(), x="SalePrice", title="Sale Price Distribution")
-
-        fig_path = os.path.join(output_dir, "sale_price_distribution.html")
-        fig.write_html(fig_path)
+        if self._scalable():
+            #Statistics and Figure Data From One Plan (shared scan)
+            price_statistics, df = pl.collect_all([price_statistics, lf.select("SalePrice")])
+            self._add_figure("sale_price_distribution",
+                             lambda: scalable_plots.histogram_figure(df, "SalePrice", "Sale Price Distribution", self.bins))
+        else:
+            pdf = self._pandas(["SalePrice"])
+            self._add_figure("sale_price_distribution",
+                             lambda: px.histogram(pdf, x="SalePrice", title="Sale Price Distribution"))
+            price_statistics = price_statistics.collect()
 
         return price_statistics
 
     def neighborhood_price_comparison(self) -> pl.DataFrame:
-        if self.real_state_clean_data is None:
-            raise ValueError("Cleaned data is not available. Please run clean_data() first.")
-
-        df = self.real_state_clean_data
+        lf = self._clean_lazy()
 
-        neighborhood_stats = df.group_by("Neighborhood") .agg([
+        neighborhood_stats = lf.group_by("Neighborhood") .agg([
             pl.col("SalePrice").median().alias("median_price"),
             pl.col("SalePrice").mean().alias("mean_price"),
             pl.col("SalePrice").std().alias("std_dev_price"),
@@ -67,60 +236,64 @@ class MarketAnalyzer:
 
 
 
-        output_dir = "src/real_estate_toolkit/analytics/outputs/"
-        os.makedirs(output_dir, exist_ok=True)
-
-        fig = px.box(df.to_pandas(), x="Neighborhood", y="SalePrice", title="Neighborhood Price Comparison")
-
-        fig_path = os.path.join(output_dir, "neighborhood_price_comparison.html")
-        fig.write_html(fig_path)
+        if self._scalable():
+            neighborhood_stats, df = pl.collect_all([neighborhood_stats, lf.select("Neighborhood", "SalePrice")])
+            self._add_figure("neighborhood_price_comparison",
+                             lambda: scalable_plots.box_figure(df, "Neighborhood", "SalePrice", "Neighborhood Price Comparison"))
+        else:
+            pdf = self._pandas(["Neighborhood", "SalePrice"])
+            self._add_figure("neighborhood_price_comparison",
+                             lambda: px.box(pdf, x="Neighborhood", y="SalePrice", title="Neighborhood Price Comparison"))
+            neighborhood_stats = neighborhood_stats.collect()
 
         return neighborhood_stats
 
-    def feature_correlation_heatmap(self, variables: List[str]) -> None:
-        if self.real_state_clean_data is None:
-            raise ValueError("Cleaned data is not available. Please run clean_data() first.")
-
-        df = self.real_state_clean_data.select(variables)
-
-        correlation_matrix = df.to_pandas().corr()
+    def _correlation(self, variables: Optional[List[str]], method: str) -> Tuple[np.ndarray, List[str]]:
+        #Chunked NumPy Engine (no pandas copy), Memoized per Variables/Method
+        key = (tuple(variables) if variables is not None else None, method)
+        if key not in self._correlations:
+            self._correlations[key] = correlation.correlation_matrix(self._clean_lazy(), variables, method)
+        return self._correlations[key]
 
+    def feature_correlation_heatmap(self, variables: Optional[List[str]] = None, method: str = "pearson") -> None:
+        correlation_matrix, columns = self._correlation(variables, method)
 
 
-        output_dir = "src/real_estate_toolkit/analytics/outputs/"
-        os.makedirs(output_dir, exist_ok=True)
 
-        fig = px.imshow(correlation_matrix, text_auto=True, title="Correlation Heatmap")
+        self._add_figure("correlation_heatmap",
+                         lambda: px.imshow(correlation_matrix, x=columns, y=columns, text_auto=".2f",
+                                           title="Correlation Heatmap"))
 
-        fig_path = os.path.join(output_dir, "correlation_heatmap.html")
-        fig.write_html(fig_path)
+    def top_correlated_pairs(self, k: int = 10, variables: Optional[List[str]] = None,
+                             method: str = "pearson") -> pl.DataFrame:
+        correlation_matrix, columns = self._correlation(variables, method)
+        return correlation.top_pairs(correlation_matrix, columns, k)
 
     def create_scatter_plots(self) -> Dict[str, go.Figure]:
-        if self.real_state_clean_data is None:
-            raise ValueError("Cleaned data is not available. Please run clean_data() first.")
-
-        df = self.real_state_clean_data.to_pandas()
-
+        lf = self._clean_lazy()
 
+        plots = {
+            "price_vs_square_footage": ("GrLivArea", "House Price vs. Total Square Footage"),
+            "price_vs_year_built": ("YearBuilt", "Sale Price vs. Year Built"),
+            "quality_vs_price": ("OverallQual", "Overall Quality vs. Sale Price")
+        }
 
-        output_dir = "src/real_estate_toolkit/analytics/outputs/"
-        os.makedirs(output_dir, exist_ok=True)
+        #Large Inputs: Grid Density + Stratified Sample + Trendline From Sufficient Statistics
+        if self._scalable():
+            df = lf.select("GrLivArea", "YearBuilt", "OverallQual", "SalePrice").collect()
+            scatter = lambda x, title: lambda: scalable_plots.scatter_figure(df, x, "SalePrice", title,
+                                                                             self.max_points, self.bins,
+                                                                             density=self.density)
+        else:
+            df = self._pandas(["GrLivArea", "YearBuilt", "OverallQual", "SalePrice"])
+            scatter = lambda x, title: lambda: px.scatter(df, x=x, y="SalePrice", trendline="ols", title=title)
 
-        figures = {}
 
-        fig1 = px.scatter(df, x="GrLivArea", y="SalePrice", trendline="ols", title="House Price vs. Total Square Footage")
-        fig1_path = os.path.join(output_dir, "price_vs_square_footage.html")
-        fig1.write_html(fig1_path)
-        figures["price_vs_square_footage"] = fig1
 
-        fig2 = px.scatter(df, x="YearBuilt", y="SalePrice", trendline="ols", title="Sale Price vs. Year Built")
-        fig2_path = os.path.join(output_dir, "price_vs_year_built.html")
-        fig2.write_html(fig2_path)
-        figures["price_vs_year_built"] = fig2
+        #Queue All Three, Then Collect (built and written concurrently)
+        for name, (x, title) in plots.items():
+            self._add_figure(name, scatter(x, title))
 
-        fig3 = px.scatter(df, x="OverallQual", y="SalePrice", trendline="ols", title="Overall Quality vs. Sale Price")
-        fig3_path = os.path.join(output_dir, "quality_vs_price.html")
-        fig3.write_html(fig3_path)
-        figures["quality_vs_price"] = fig3
+        figures = {name: self.figure(name) for name in plots}
 
         return figures
@@ -0,0 +1,191 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional, Union
+import io
+import json
+import os
+import numpy as np
+import polars as pl
+from real_estate_toolkit.data.sketches import KLLSketch
+from real_estate_toolkit.data.cache import atomic_write
+
+STATE_VERSION = 1
+KEY_COLUMNS = ["Neighborhood", "YrSold", "MoSold"]
+SCHEMA = {"Neighborhood": pl.Utf8, "YrSold": pl.Int64, "MoSold": pl.Int64, "SalePrice": pl.Float64}
+
+@dataclass
+class PriceAggregate:
+    #Mergeable Summary of SalePrice for One Group
+    count: int = 0
+    total: float = 0.0
+    total_squares: float = 0.0
+    minimum: float = np.inf
+    maximum: float = -np.inf
+    sketch: KLLSketch = field(default_factory=KLLSketch)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return
+        self.count += values.size
+        self.total += float(values.sum())
+        self.total_squares += float(np.dot(values, values))
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        self.sketch.update(values)
+
+    def merge(self, other: "PriceAggregate") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def std(self) -> Optional[float]:
+        #Sample Standard Deviation (ddof=1, like polars)
+        if self.count < 2:
+            return None
+        variance = (self.total_squares - self.total ** 2 / self.count) / (self.count - 1)
+        return float(np.sqrt(max(variance, 0.0)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "total": self.total, "total_squares": self.total_squares,
+                "minimum": self.minimum, "maximum": self.maximum, "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "PriceAggregate":
+        return cls(count=state["count"], total=state["total"], total_squares=state["total_squares"],
+                   minimum=state["minimum"], maximum=state["maximum"],
+                   sketch=KLLSketch.from_dict(state["sketch"]))
+
+@dataclass
+class IncrementalMarketStatistics:
+    #Per (Neighborhood, YrSold, MoSold) aggregates of an append-only CSV.
+    #refresh() parses only the bytes appended since the last call.
+    state_path: Path
+    k: int = 200
+    header: Optional[str] = None
+    bytes_seen: int = 0
+    rows_seen: int = 0
+    groups: Dict[Tuple[str, int, int], PriceAggregate] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, state_path: Union[str, Path], k: int = 200) -> "IncrementalMarketStatistics":
+        state_path = Path(state_path)
+        if not state_path.exists():
+            return cls(state_path, k=k)
+
+        with open(state_path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Oops!  {state_path} has no valid state version.  Try again...")
+
+        return cls(state_path, k=state["k"], header=state["header"], bytes_seen=state["bytes_seen"],
+                   rows_seen=state["rows_seen"],
+                   groups={(neighborhood, year, month): PriceAggregate.from_dict(aggregate)
+                           for neighborhood, year, month, aggregate in state["groups"]})
+
+    def save(self) -> None:
+        state = {
+            "version": STATE_VERSION, "k": self.k, "header": self.header,
+            "bytes_seen": self.bytes_seen, "rows_seen": self.rows_seen,
+            "groups": [[*key, aggregate.to_dict()] for key, aggregate in self.groups.items()]
+        }
+
+        #Atomic Write (a crashed refresh keeps the previous state)
+        atomic_write(self.state_path, lambda tmpPath: Path(tmpPath).write_text(json.dumps(state), encoding="utf-8"))
+
+    def _read_new_rows(self, data_path: Union[str, Path]) -> Optional[pl.DataFrame]:
+        with open(data_path, "rb") as file:
+            header = file.readline()
+            if self.header is None:
+                self.header = header.decode("utf-8")
+                self.bytes_seen = len(header)
+            elif header.decode("utf-8") != self.header:
+                raise ValueError(f"Oops!  {data_path} header changed since the last refresh.  Try again...")
+
+            if os.fstat(file.fileno()).st_size < self.bytes_seen:
+                raise ValueError(f"Oops!  {data_path} was truncated since the last refresh.  Try again...")
+
+            file.seek(self.bytes_seen)
+            chunk = file.read()
+
+        #Complete Lines Only (a row still being appended waits for the next refresh)
+        chunk = chunk[:chunk.rfind(b"\n") + 1]
+        if not chunk:
+            return None
+        self.bytes_seen += len(chunk)
+
+        return pl.read_csv(io.BytesIO(header + chunk), columns=list(SCHEMA), schema_overrides=SCHEMA,
+                           null_values="NA")
+
+    def refresh(self, data_path: Union[str, Path]) -> int:
+        #Fold Appended Rows Into the Groups, Returns the Number of New Rows
+        df = self._read_new_rows(data_path)
+        if df is None:
+            return 0
+        self.rows_seen += len(df)
+
+        grouped = df.drop_nulls().group_by(KEY_COLUMNS).agg(pl.col("SalePrice"))
+        for neighborhood, year, month, prices in grouped.iter_rows():
+            key = (neighborhood, year, month)
+            if key not in self.groups:
+                self.groups[key] = PriceAggregate(sketch=KLLSketch(k=self.k))
+            self.groups[key].update(np.asarray(prices, dtype=float))
+
+        return len(df)
+
+    def _window(self, window_months: Optional[int],
+                end: Optional[Tuple[int, int]]) -> List[Tuple[Tuple[str, int, int], PriceAggregate]]:
+        if window_months is None:
+            return list(self.groups.items())
+        if not self.groups:
+            return []
+
+        #Months (end - window, end], end Defaults to the Latest Sale
+        months = lambda year, month: year * 12 + month - 1
+        last = months(*end) if end is not None else max(months(year, month) for _, year, month in self.groups)
+        return [(key, aggregate) for key, aggregate in self.groups.items()
+                if last - window_months < months(key[1], key[2]) <= last]
+
+    def _merged(self, aggregates: List[PriceAggregate]) -> PriceAggregate:
+        merged = PriceAggregate(sketch=KLLSketch(k=self.k))
+        for aggregate in aggregates:
+            merged.merge(aggregate)
+        return merged
+
+    def price_distribution(self, window_months: Optional[int] = None,
+                           end: Optional[Tuple[int, int]] = None) -> pl.DataFrame:
+        #Same Columns as MarketAnalyzer.generate_price_distribution_analysis
+        merged = self._merged([aggregate for _, aggregate in self._window(window_months, end)])
+        return pl.DataFrame({
+            "mean": [merged.mean],
+            "median": [merged.sketch.quantile(0.5)],
+            "std_dev": [merged.std],
+            "min": [merged.minimum if merged.count else None],
+            "max": [merged.maximum if merged.count else None]
+        }, schema={column: pl.Float64 for column in ["mean", "median", "std_dev", "min", "max"]})
+
+    def neighborhood_statistics(self, window_months: Optional[int] = None,
+                                end: Optional[Tuple[int, int]] = None) -> pl.DataFrame:
+        #Same Columns as MarketAnalyzer.neighborhood_price_comparison (+ count)
+        byNeighborhood: Dict[str, List[PriceAggregate]] = {}
+        for (neighborhood, _, _), aggregate in self._window(window_months, end):
+            byNeighborhood.setdefault(neighborhood, []).append(aggregate)
+
+        rows = []
+        for neighborhood in sorted(byNeighborhood):
+            merged = self._merged(byNeighborhood[neighborhood])
+            rows.append({"Neighborhood": neighborhood, "count": merged.count,
+                         "median_price": merged.sketch.quantile(0.5), "mean_price": merged.mean,
+                         "std_dev_price": merged.std, "min_price": merged.minimum, "max_price": merged.maximum})
+
+        schema = {"Neighborhood": pl.Utf8, "count": pl.Int64, "median_price": pl.Float64, "mean_price": pl.Float64,
+                  "std_dev_price": pl.Float64, "min_price": pl.Float64, "max_price": pl.Float64}
+        return pl.DataFrame(rows, schema=schema)
@@ -0,0 +1,144 @@
+from typing import Dict, Tuple, Optional
+import numpy as np
+import polars as pl
+import plotly.graph_objects as go
+
+#Figures whose size depends on the number of bins/cells/points kept, never on
+#the number of rows: everything is aggregated in polars before plotly sees it.
+
+def _bin_index(column: str, minimum: float, width: float, bins: int) -> pl.Expr:
+    return ((pl.col(column) - minimum) / width).floor().clip(0, bins - 1).cast(pl.Int64)
+
+def _range(df: pl.DataFrame, column: str, bins: int) -> Tuple[float, float]:
+    bounds = df.select(pl.col(column).min().alias("min"), pl.col(column).max().alias("max")).row(0)
+    if bounds[0] is None:
+        return 0.0, 1.0
+    minimum, maximum = float(bounds[0]), float(bounds[1])
+    width = (maximum - minimum) / bins
+    return minimum, width if width > 0 else 1.0
+
+def binned_counts(df: pl.DataFrame, column: str, bins: int = 50) -> pl.DataFrame:
+    #(bin, count, left, right) of the non-null values, equal-width bins
+    df = df.select(column).drop_nulls()
+    minimum, width = _range(df, column, bins)
+
+    return (
+        df.group_by(_bin_index(column, minimum, width, bins).alias("bin"))
+        .agg(pl.len().alias("count"))
+        .sort("bin")
+        .with_columns((minimum + pl.col("bin") * width).alias("left"))
+        .with_columns((pl.col("left") + width).alias("right"))
+    )
+
+def histogram_figure(df: pl.DataFrame, column: str, title: str, bins: int = 50) -> go.Figure:
+    counts = binned_counts(df, column, bins)
+    width = (counts["right"] - counts["left"]).to_list()
+
+    fig = go.Figure(go.Bar(x=((counts["left"] + counts["right"]) / 2).to_list(), y=counts["count"].to_list(),
+                           width=width, name=column))
+    fig.update_layout(title=title, xaxis_title=column, yaxis_title="count", bargap=0)
+    return fig
+
+def box_figure(df: pl.DataFrame, group: str, value: str, title: str) -> go.Figure:
+    #Precomputed Quartiles and 1.5 IQR Fences (plotly's defaults), No Points
+    q1, q3 = pl.col(value).quantile(0.25, "linear"), pl.col(value).quantile(0.75, "linear")
+    iqr = q3 - q1
+    boxes = (
+        df.select(group, value).drop_nulls()
+        .group_by(group)
+        .agg(
+            q1.alias("q1"),
+            pl.col(value).median().alias("median"),
+            q3.alias("q3"),
+            pl.col(value).mean().alias("mean"),
+            pl.col(value).filter(pl.col(value) >= q1 - 1.5 * iqr).min().alias("lowerfence"),
+            pl.col(value).filter(pl.col(value) <= q3 + 1.5 * iqr).max().alias("upperfence")
+        )
+        .sort(group)
+    )
+
+    fig = go.Figure(go.Box(x=boxes[group].cast(pl.Utf8).to_list(), q1=boxes["q1"].to_list(),
+                           median=boxes["median"].to_list(), q3=boxes["q3"].to_list(),
+                           mean=boxes["mean"].to_list(), lowerfence=boxes["lowerfence"].to_list(),
+                           upperfence=boxes["upperfence"].to_list(), name=value))
+    fig.update_layout(title=title, xaxis_title=group, yaxis_title=value)
+    return fig
+
+def grid_density(df: pl.DataFrame, x: str, y: str, bins: int = 50) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    #(x centers, y centers, counts[y, x]) on a bins x bins grid
+    df = df.select(x, y).drop_nulls()
+    xMinimum, xWidth = _range(df, x, bins)
+    yMinimum, yWidth = _range(df, y, bins)
+
+    cells = (
+        df.group_by(_bin_index(x, xMinimum, xWidth, bins).alias("x_bin"),
+                    _bin_index(y, yMinimum, yWidth, bins).alias("y_bin"))
+        .agg(pl.len().alias("count"))
+    )
+    counts = np.zeros((bins, bins))
+    counts[cells["y_bin"].to_numpy(), cells["x_bin"].to_numpy()] = cells["count"].to_numpy()
+
+    return xMinimum + (np.arange(bins) + 0.5) * xWidth, yMinimum + (np.arange(bins) + 0.5) * yWidth, counts
+
+def density_trace(df: pl.DataFrame, x: str, y: str, bins: int = 50) -> go.Heatmap:
+    #Counts of All Rows per Grid Cell (empty cells transparent)
+    xCenters, yCenters, counts = grid_density(df, x, y, bins)
+    return go.Heatmap(x=xCenters, y=yCenters, z=np.where(counts > 0, counts, np.nan), colorscale="Blues",
+                      colorbar={"title": "rows"}, name="row density")
+
+def stratified_sample(df: pl.DataFrame, x: str, y: str, max_points: int,
+                      bins: int = 50, seed: Optional[int] = 0) -> pl.DataFrame:
+    #Random rows per grid cell, proportional to the cell count but at least
+    #one, so sparse regions and outliers survive: at most max_points + bins**2
+    df = df.select(x, y).drop_nulls()
+    if len(df) <= max_points:
+        return df
+
+    xMinimum, xWidth = _range(df, x, bins)
+    yMinimum, yWidth = _range(df, y, bins)
+    cell = _bin_index(x, xMinimum, xWidth, bins) * bins + _bin_index(y, yMinimum, yWidth, bins)
+
+    return (
+        df.with_columns(cell.alias("cell"), pl.int_range(pl.len()).shuffle(seed).alias("key"))
+        .filter(pl.col("key").rank("ordinal").over("cell")
+                <= (pl.len().over("cell") * (max_points / len(df))).ceil())
+        .select(x, y)
+    )
+
+def ols_statistics(df: pl.DataFrame, x: str, y: str) -> Dict[str, float]:
+    #Slope/Intercept/R2 (and x range) From Means and (Co)Variances Alone
+    n, xMean, yMean, covariance, xVariance, yVariance, xMinimum, xMaximum = df.select(x, y).drop_nulls().select(
+        pl.len().alias("n"),
+        pl.col(x).mean().alias("x_mean"),
+        pl.col(y).mean().alias("y_mean"),
+        pl.cov(x, y).alias("covariance"),
+        pl.col(x).var().alias("x_variance"),
+        pl.col(y).var().alias("y_variance"),
+        pl.col(x).min().alias("x_min"),
+        pl.col(x).max().alias("x_max")
+    ).row(0)
+
+    if not n or not xVariance:
+        return {"n": n, "slope": None, "intercept": None, "r2": None, "x_min": xMinimum, "x_max": xMaximum}
+
+    slope = covariance / xVariance
+    r2 = covariance ** 2 / (xVariance * yVariance) if yVariance else 1.0
+    return {"n": n, "slope": slope, "intercept": yMean - slope * xMean, "r2": r2, "x_min": xMinimum, "x_max": xMaximum}
+
+def scatter_figure(df: pl.DataFrame, x: str, y: str, title: str, max_points: int = 20_000,
+                   bins: int = 50, seed: Optional[int] = 0, density: bool = True) -> go.Figure:
+    #Grid Density of All Rows Under the Sampled Points
+    fig = go.Figure(density_trace(df, x, y, bins)) if density else go.Figure()
+    sample = stratified_sample(df, x, y, max_points, bins, seed)
+    fig.add_trace(go.Scattergl(x=sample[x].to_numpy(), y=sample[y].to_numpy(), mode="markers",
+                               marker={"opacity": 0.5}, name=f"{len(sample)} of {len(df)} rows"))
+
+    #Trendline Over All Rows (not the sample)
+    ols = ols_statistics(df, x, y)
+    if ols["slope"] is not None:
+        bounds = np.array([ols["x_min"], ols["x_max"]], dtype=float)
+        fig.add_trace(go.Scatter(x=bounds, y=ols["intercept"] + ols["slope"] * bounds, mode="lines",
+                                 name=f"OLS trendline (R²={ols['r2']:.3f})"))
+
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
@@ -0,0 +1,84 @@
+from pathlib import Path
+from typing import Callable, Dict, Tuple, Union
+import hashlib
+import os
+import tempfile
+import polars as pl
+
+CACHE_DIR_ENV = "REAL_ESTATE_TOOLKIT_CACHE_DIR"
+CACHE_VERSION = 1
+
+#(path, size, mtime) -> content digest (avoids rehashing within a process)
+_digests: Dict[Tuple[str, int, int], str] = {}
+
+def cache_dir() -> Path:
+    return Path(os.environ.get(CACHE_DIR_ENV, Path.home() / ".cache" / "real_estate_toolkit"))
+
+def file_digest(path: Union[str, Path]) -> str:
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+
+    if key not in _digests:
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        _digests[key] = digest.hexdigest()
+
+    return _digests[key]
+
+def frame_digest(df: pl.DataFrame) -> str:
+    #Schema + Row Hashes (same data and dtypes -> same digest)
+    digest = hashlib.blake2b(str(list(df.schema.items())).encode(), digest_size=20)
+    digest.update(df.hash_rows(seed=0).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def cache_path(path: Union[str, Path], null_values: str = "NA") -> Path:
+    #Content + Parse Options + Polars Version
+    key = f"{file_digest(path)}|{null_values}|{pl.__version__}|{CACHE_VERSION}"
+    name = hashlib.blake2b(key.encode(), digest_size=20).hexdigest()
+    return cache_dir() / f"{name}.arrow"
+
+def atomic_write(path: Union[str, Path], write: Callable[[str], None]) -> None:
+    #write(tmpPath) Next to path, Then Rename (readers never see a partial file)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmpPath = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmpPath)
+        os.replace(tmpPath, path)
+    except BaseException:
+        os.remove(tmpPath)
+        raise
+
+def read_csv_cached(path: Union[str, Path], null_values: str = "NA") -> pl.DataFrame:
+    ipcPath = cache_path(path, null_values)
+
+    #Hit: Memory-Mapped Arrow IPC
+    if ipcPath.exists():
+        return pl.read_ipc(ipcPath, memory_map=True)
+
+    #Miss: Parse Once, Store
+    df = pl.read_csv(path, null_values=null_values)
+    try:
+        atomic_write(ipcPath, lambda tmpPath: df.write_ipc(tmpPath, compression="uncompressed"))
+    except OSError:
+        pass
+
+    return df
+
+def scan_csv_cached(path: Union[str, Path], null_values: str = "NA") -> pl.LazyFrame:
+    #Same Cache File as read_csv_cached, Scanned Lazily (projection pushdown)
+    ipcPath = cache_path(path, null_values)
+
+    if not ipcPath.exists():
+        try:
+            #Streaming (the CSV is never fully materialized)
+            atomic_write(ipcPath, lambda tmpPath: pl.scan_csv(path, null_values=null_values)
+                         .sink_ipc(tmpPath, compression=None))
+        except (OSError, pl.exceptions.PolarsError):
+            return pl.scan_csv(path, null_values=null_values)
+
+    return pl.scan_ipc(ipcPath, memory_map=True)
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union, Tuple
+import polars as pl
+from real_estate_toolkit.data.dataset import ColumnarDataset
 
 @dataclass
 class Cleaner:
-    data: List[Dict[str, Any]]
+    data: Union[List[Dict[str, Any]], ColumnarDataset, pl.DataFrame]
+    sentinels: Tuple[str, ...] = ("NA",)
+    infer_types: bool = False
 
     def snake_case(self, colName: str) -> str:
         import re
@@ -11,11 +15,19 @@ class Cleaner:
         return colName
 
     def rename_with_best_practices(self) -> None:
-        dataKeys = self.data[0].keys()
+        if isinstance(self.data, (ColumnarDataset, pl.DataFrame)):
+            dataKeys = self.data.columns
+        else:
+            dataKeys = self.data[0].keys()
 
         #New Data Keys
         dataKeysNew = {key: self.snake_case(key) for key in dataKeys}
 
+        #Rename (Columnar: schema only)
+        if isinstance(self.data, (ColumnarDataset, pl.DataFrame)):
+            self.data = self.data.rename(dataKeysNew)
+            return self.data
+
         #Rename
         for row in self.data:
             for keyOld, keyNew in dataKeysNew.items():
@@ -23,10 +35,66 @@ class Cleaner:
 
         return self.data
 
-    def na_to_none(self) -> List[Dict[str, Any]]:
+    def _infer_types(self, df: pl.DataFrame) -> pl.DataFrame:
+        stringCols = [col for col, dtype in df.schema.items() if dtype == pl.Utf8]
+        if not stringCols:
+            return df
+
+        #Null Counts Before/After Casting (one pass)
+        counts = df.select(
+            [pl.col(col).null_count().alias(f"{col}|null") for col in stringCols]
+            + [pl.col(col).str.strip_chars().cast(pl.Int64, strict=False).null_count().alias(f"{col}|int")
+               for col in stringCols]
+            + [pl.col(col).str.strip_chars().cast(pl.Float64, strict=False).null_count().alias(f"{col}|float")
+               for col in stringCols]
+        ).row(0, named=True)
+
+        castExprs = []
+        for col in stringCols:
+            if counts[f"{col}|int"] == counts[f"{col}|null"]:
+                castExprs.append(pl.col(col).str.strip_chars().cast(pl.Int64, strict=False))
+            elif counts[f"{col}|float"] == counts[f"{col}|null"]:
+                castExprs.append(pl.col(col).str.strip_chars().cast(pl.Float64, strict=False))
+
+        return df.with_columns(castExprs) if castExprs else df
+
+    def _na_to_none_frame(self, df: pl.DataFrame) -> pl.DataFrame:
+        stringCols = [col for col, dtype in df.schema.items() if dtype == pl.Utf8]
+
+        def is_sentinel(col: str) -> pl.Expr:
+            #Chained Equality (faster than is_in for a handful of sentinels)
+            return pl.any_horizontal([pl.col(col) == sentinel for sentinel in self.sentinels])
+
+        #Single Vectorized Pass
+        df = df.with_columns([
+            pl.when(is_sentinel(col)).then(None).otherwise(pl.col(col)).alias(col)
+            for col in stringCols
+        ])
+
+        if self.infer_types:
+            df = self._infer_types(df)
+
+        return df
+
+    def na_to_none(self) -> Union[List[Dict[str, Any]], ColumnarDataset, pl.DataFrame]:
+        if isinstance(self.data, pl.DataFrame):
+            self.data = self._na_to_none_frame(self.data)
+            return self.data
+
+        if isinstance(self.data, ColumnarDataset):
+            if self.infer_types:
+                self.data = ColumnarDataset.from_polars(self._na_to_none_frame(self.data.to_polars()))
+                return self.data
+
+            for column in self.data.columns:
+                if not self.data.is_numeric(column):
+                    for sentinel in self.sentinels:
+                        self.data.nulls[column] = self.data.nulls[column] | (self.data.values[column] == sentinel)
+            return self.data
+
         for row in self.data:
             for key, value in row.items():
-                if value == "NA":
+                if value in self.sentinels:
                     row[key] = None
 
         return self.data
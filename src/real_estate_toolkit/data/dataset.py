@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from typing import Dict, List, Any, Iterator, Sequence
+import numpy as np
+import polars as pl
+
+def _to_python(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+class RowsView(Sequence):
+    #Lazy List[Dict] view over a ColumnarDataset (rows are built on access)
+    def __init__(self, dataset: "ColumnarDataset", chunk_size: int = 4096):
+        self.dataset = dataset
+        self.chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.dataset.row(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Oops!  {index} was no valid row.  Try again...")
+
+        return self.dataset.row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        columns = self.dataset.columns
+
+        #Chunks of Python Lists (tolist is much faster than per-cell item())
+        for start in range(0, len(self), self.chunk_size):
+            stop = min(start + self.chunk_size, len(self))
+            valuesChunk = [self.dataset.values[column][start:stop].tolist() for column in columns]
+            nullsChunk = [self.dataset.nulls[column][start:stop].tolist() for column in columns]
+
+            for i in range(stop - start):
+                yield {column: (None if nullsChunk[j][i] else valuesChunk[j][i])
+                       for j, column in enumerate(columns)}
+
+@dataclass
+class ColumnarDataset:
+    values: Dict[str, np.ndarray]
+    nulls: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_polars(cls, df: pl.DataFrame) -> "ColumnarDataset":
+        values = {}
+        nulls = {}
+
+        for column in df.columns:
+            series = df[column]
+            nulls[column] = series.is_null().to_numpy()
+
+            #Typed Arrays (Numeric), Object Arrays (Everything Else)
+            if series.dtype.is_numeric():
+                values[column] = series.fill_null(0).to_numpy()
+            elif series.dtype == pl.Boolean:
+                values[column] = series.fill_null(False).to_numpy()
+            else:
+                values[column] = series.to_numpy().astype(object)
+
+        return cls(values, nulls)
+
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> "ColumnarDataset":
+        df = pl.from_dicts(rows, infer_schema_length=None)
+        return cls.from_polars(df)
+
+    def __len__(self) -> int:
+        if not self.values:
+            return 0
+        return len(next(iter(self.values.values())))
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.values.keys())
+
+    def column(self, column: str) -> np.ndarray:
+        if column not in self.values:
+            raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
+        return self.values[column]
+
+    def null_mask(self, column: str) -> np.ndarray:
+        if column not in self.nulls:
+            raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
+        return self.nulls[column]
+
+    def valid_values(self, column: str) -> np.ndarray:
+        return self.column(column)[~self.null_mask(column)]
+
+    def is_numeric(self, column: str) -> bool:
+        return self.column(column).dtype.kind in "iuf"
+
+    def rename(self, mapping: Dict[str, str]) -> "ColumnarDataset":
+        #Schema Only (no data is copied)
+        values = {mapping.get(column, column): array for column, array in self.values.items()}
+        nulls = {mapping.get(column, column): mask for column, mask in self.nulls.items()}
+        return ColumnarDataset(values, nulls)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        return {column: (None if self.nulls[column][index] else _to_python(array[index]))
+                for column, array in self.values.items()}
+
+    def to_dicts(self) -> RowsView:
+        return RowsView(self)
+
+    def to_polars(self) -> pl.DataFrame:
+        #Object Arrays -> Inferred Polars Dtype (e.g. str)
+        df = pl.DataFrame([pl.Series(column, array, strict=False) for column, array in self.values.items()])
+        masks = pl.DataFrame({column: mask for column, mask in self.nulls.items()})
+
+        return df.with_columns([
+            pl.when(masks[column]).then(None).otherwise(pl.col(column)).alias(column)
+            for column in df.columns
+        ])
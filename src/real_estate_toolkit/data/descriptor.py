@@ -1,22 +1,79 @@
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Any, Union
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Any, Union, Sequence, Iterable, Optional
+from real_estate_toolkit.data.dataset import ColumnarDataset
+
+#Helpers (List[Dict] or ColumnarDataset)
+def _all_columns(data) -> List[str]:
+    if isinstance(data, ColumnarDataset):
+        return data.columns
+    return list(data[0].keys())
+
+def _has_column(data, column: str) -> bool:
+    if isinstance(data, ColumnarDataset):
+        return column in data.values
+    return column in data[0]
+
+def _is_numeric(data, column: str) -> bool:
+    if isinstance(data, ColumnarDataset):
+        return data.is_numeric(column)
+    return isinstance(data[0][column], (int, float))
+
+def _numeric_columns(data) -> List[str]:
+    return [key for key in _all_columns(data) if _is_numeric(data, key)]
+
+def _first_value(data, column: str) -> Any:
+    if isinstance(data, ColumnarDataset):
+        return data.row(0)[column] if len(data) else None
+    return data[0][column]
 
 @dataclass
 class Descriptor:
-    data: List[Dict[str, Any]]
+    data: Union[List[Dict[str, Any]], ColumnarDataset]
+
+    def _values(self, column: str) -> List[Any]:
+        if isinstance(self.data, ColumnarDataset):
+            return self.data.valid_values(column).tolist()
+        return [row[column] for row in self.data if row[column] is not None]
+
+#describeAll
+    def describe_all(self, columns: Union[List[str], str] = "all",
+                     percentiles: Sequence[int] = (25, 50, 75)) -> Dict[str, Dict[str, Any]]:
+        descriptorNumpy = DescriptorNumpy(self.data)
+        profile = descriptorNumpy.describe_all(columns, percentiles)
+
+        #Python Scalars (same types as type_and_mode)
+        for column, stats in profile.items():
+            values = descriptorNumpy._values(column)
+            if values.size > 0:
+                pythonType = type(values[0].item())
+                stats["type"] = pythonType.__name__
+                stats["mode"] = pythonType(stats["mode"])
+
+            for key, value in stats.items():
+                if isinstance(value, dict):
+                    stats[key] = {p: float(v) for p, v in value.items()}
+                elif isinstance(value, np.generic):
+                    stats[key] = value.item()
+
+        return profile
 
 #noneRatio
     def none_ratio(self, columns: Union[List[str], str] = "all"):
         if columns == "all":
-            columns = list(self.data[0].keys())
+            columns = _all_columns(self.data)
 
         noneRatioResult = {}
 
         #Cols are Keys
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
 
+            #Columnar: Null Mask
+            if isinstance(self.data, ColumnarDataset):
+                noneRatioResult[column] = int(self.data.null_mask(column).sum()) / len(self.data)
+                continue
+
             noneCount = 0
             #Rows are Values
             for row in self.data:
@@ -29,19 +86,17 @@ class Descriptor:
 #avg
     def average(self, columns: Union[List[str], str] = "all") -> Dict[str, float]:
         if columns == "all":
-            columns = [key for key in self.data[0].keys() if isinstance(self.data[0][key],
-                                                                        (int, float))]
+            columns = _numeric_columns(self.data)
 
         avgResult = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
-            elif not isinstance(self.data[0][column],
-                                (int, float)):
+            elif not _is_numeric(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid NUMERIC column.  Try again...")
 
-            values = [row[column] for row in self.data if row[column] is not None]
+            values = self._values(column)
             avgResult[column] = sum(values) / len(values) if values else None
 
         return avgResult
@@ -51,19 +106,17 @@ class Descriptor:
         import statistics
 
         if columns == "all":
-            columns = [key for key in self.data[0].keys() if isinstance(self.data[0][key],
-                                                                        (int, float))]
+            columns = _numeric_columns(self.data)
 
         mdnResult = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
-            elif not isinstance(self.data[0][column],
-                                (int, float)):
+            elif not _is_numeric(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid NUMERIC column.  Try again...")
 
-            values = [row[column] for row in self.data if row[column] is not None]
+            values = self._values(column)
             mdnResult[column] = statistics.median(values) if values else None
 
         return mdnResult
@@ -73,19 +126,17 @@ class Descriptor:
         import statistics
 
         if columns == "all":
-            columns = [key for key in self.data[0].keys() if isinstance(self.data[0][key],
-                                                                        (int, float))]
+            columns = _numeric_columns(self.data)
 
         pctlResult = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
-            elif not isinstance(self.data[0][column],
-                                (int, float)):
+            elif not _is_numeric(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid NUMERIC column.  Try again...")
 
-            values = [row[column] for row in self.data if row[column] is not None]
+            values = self._values(column)
             pctlResult[column] = statistics.quantiles(values, n=100, method="inclusive")[percentile-1] if values else None
 
         return pctlResult
@@ -97,20 +148,20 @@ class Descriptor:
         import statistics
 
         if columns == "all":
-            columns = list(self.data[0].keys())
+            columns = _all_columns(self.data)
 
         typeModeResult = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
 
 
 
-            values = [row[column] for row in self.data if row[column] is not None]
+            values = self._values(column)
             if not values:
                 #__name__
-                typeModeResult[column] = (type(self.data[0][column]).__name__, None)
+                typeModeResult[column] = (type(_first_value(self.data, column)).__name__, None)
             elif isinstance(values[0], (int, float)):
                 typeModeResult[column] = (type(values[0]).__name__, statistics.mode(values))
             else:
@@ -125,22 +176,92 @@ import numpy as np
 
 @dataclass
 class DescriptorNumpy:
-    data: List[Dict[str, Any]]
+    data: Union[List[Dict[str, Any]], ColumnarDataset]
+    _dataset: ColumnarDataset = field(default=None, init=False, repr=False, compare=False)
+    _cache: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _typed_dataset(self) -> ColumnarDataset:
+        #Rows -> Typed Columns (once)
+        if self._dataset is None:
+            if isinstance(self.data, ColumnarDataset):
+                self._dataset = self.data
+            else:
+                self._dataset = ColumnarDataset.from_dicts(self.data)
+        return self._dataset
+
+    def _values(self, column: str) -> np.ndarray:
+        if column not in self._cache:
+            dataset = self._typed_dataset()
+            values = dataset.valid_values(column)
+            self._cache[column] = values if dataset.is_numeric(column) else values.astype(str)
+        return self._cache[column]
+
+    def _mode(self, values: np.ndarray) -> Any:
+        if np.issubdtype(values.dtype, np.integer) and values.min() >= 0:
+            return float(np.bincount(values).argmax())
+
+        unique, counts = np.unique(values, return_counts=True)
+        if np.issubdtype(values.dtype, np.number):
+            return float(unique[np.argmax(counts)])
+        return str(unique[np.argmax(counts)])
+
+#describeAll
+    def describe_all(self, columns: Union[List[str], str] = "all",
+                     percentiles: Sequence[int] = (25, 50, 75)) -> Dict[str, Dict[str, Any]]:
+        if columns == "all":
+            columns = _all_columns(self.data)
+
+        if any(not 0 <= percentile <= 100 for percentile in percentiles):
+            raise ValueError(f"Oops!  {list(percentiles)} are no valid percentiles.  Try again...")
+
+        dataset = self._typed_dataset()
+        describeResult = {}
+
+        for column in columns:
+            if not _has_column(self.data, column):
+                raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
+
+            values = self._values(column)
+            stats = {"none_ratio": float(np.sum(dataset.null_mask(column))) / len(dataset)}
+
+            if values.size == 0:
+                stats["type"] = type(_first_value(self.data, column)).__name__
+                stats["mode"] = None
+                describeResult[column] = stats
+                continue
+
+            stats["type"] = type(values[0]).__name__
+            stats["mode"] = self._mode(values)
+
+            #Numeric: One Sort for Median, Percentiles
+            if _is_numeric(self.data, column):
+                sortedValues = np.sort(values)
+                #Linear Interpolation Between Order Statistics (np.percentile's default)
+                positions = np.array([50, *percentiles], dtype=float) / 100 * (sortedValues.size - 1)
+                lower = np.floor(positions).astype(np.int64)
+                upper = np.minimum(lower + 1, sortedValues.size - 1)
+                quantiles = sortedValues[lower] + (sortedValues[upper] - sortedValues[lower]) * (positions - lower)
+                stats["mean"] = np.mean(values)
+                stats["median"] = quantiles[0]
+                stats["percentiles"] = dict(zip(percentiles, quantiles[1:]))
+
+            describeResult[column] = stats
+
+        return describeResult
 
 #1
     def none_ratio(self, columns: Union[List[str], str] = "all"):
         if columns == "all":
-            columns = list(self.data[0].keys())
+            columns = _all_columns(self.data)
 
         noneRatioResultNp = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
 
             #NumPy
-            values = np.array([row[column] for row in self.data])
-            noneCount = np.sum(values == None)
+            noneCount = np.sum(self._typed_dataset().null_mask(column))
             noneRatioResultNp[column] = noneCount / len(self.data)
 
         return noneRatioResultNp
@@ -148,20 +269,18 @@ class DescriptorNumpy:
 #2
     def average(self, columns: Union[List[str], str] = "all") -> Dict[str, float]:
         if columns == "all":
-            columns = [key for key in self.data[0].keys() if isinstance(self.data[0][key],
-                                                                        (int, float))]
+            columns = _numeric_columns(self.data)
 
         avgResultNp = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
-            elif not isinstance(self.data[0][column],
-                                (int, float)):
+            elif not _is_numeric(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid NUMERIC column.  Try again...")
 
             #NumPy
-            values = np.array([row[column] for row in self.data if row[column] is not None])
+            values = self._values(column)
             avgResultNp[column] = np.mean(values) if values.size > 0 else None
 
         return avgResultNp
@@ -169,20 +288,18 @@ class DescriptorNumpy:
 #3
     def median(self, columns: Union[List[str], str] = "all") -> Dict[str, float]:
         if columns == "all":
-            columns = [key for key in self.data[0].keys() if isinstance(self.data[0][key],
-                                                                        (int, float))]
+            columns = _numeric_columns(self.data)
 
         mdnResultNp = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
-            elif not isinstance(self.data[0][column],
-                                (int, float)):
+            elif not _is_numeric(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid NUMERIC column.  Try again...")
 
             #NumPy
-            values = np.array([row[column] for row in self.data if row[column] is not None])
+            values = self._values(column)
             mdnResultNp[column] = np.median(values) if values.size > 0 else None
 
         return mdnResultNp
@@ -190,20 +307,18 @@ class DescriptorNumpy:
 #4
     def percentile(self, columns: Union[List[str], str] = "all", percentile: int = 50) -> Dict[str, float]:
         if columns == "all":
-            columns = [key for key in self.data[0].keys() if isinstance(self.data[0][key],
-                                                                        (int, float))]
+            columns = _numeric_columns(self.data)
 
         pctlResultNp = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
-            elif not isinstance(self.data[0][column],
-                                (int, float)):
+            elif not _is_numeric(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid NUMERIC column.  Try again...")
 
             #NumPy
-            values = np.array([row[column] for row in self.data if row[column] is not None])
+            values = self._values(column)
             pctlResultNp[column] = np.percentile(values, percentile) if values.size > 0 else None
 
         return pctlResultNp
@@ -213,22 +328,118 @@ class DescriptorNumpy:
                                                                             Union[Tuple[str, float],
                                                                                   Tuple[str, str]]]:
         if columns == "all":
-            columns = list(self.data[0].keys())
+            columns = _all_columns(self.data)
 
         typeModeResultNp = {}
 
         for column in columns:
-            if column not in self.data[0]:
+            if not _has_column(self.data, column):
                 raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
 
             #NumPy
-            values = np.array([row[column] for row in self.data if row[column] is not None])
+            values = self._values(column)
             if values.size == 0:
-                typeModeResultNp[column] = (type(self.data[0][column]).__name__, None)
-            elif np.issubdtype(values.dtype, np.number):
-                typeModeResultNp[column] = (type(values[0]).__name__, float(np.bincount(values).argmax()))
+                typeModeResultNp[column] = (type(_first_value(self.data, column)).__name__, None)
             else:
-                unique, counts = np.unique(values, return_counts=True)
-                typeModeResultNp[column] = (type(values[0]).__name__, str(unique[np.argmax(counts)]))
+                typeModeResultNp[column] = (type(values[0]).__name__, self._mode(values))
 
         return typeModeResultNp
+
+
+
+#Sketches (streaming, mergeable)
+import polars as pl
+from real_estate_toolkit.data.sketches import KLLSketch, HeavyHittersSketch
+
+@dataclass
+class SketchDescriptor:
+    k: int = 200
+    capacity: int = 64
+    seed: Optional[int] = None
+    rows: int = 0
+    nones: Dict[str, int] = field(default_factory=dict)
+    sums: Dict[str, float] = field(default_factory=dict)
+    types: Dict[str, str] = field(default_factory=dict)
+    quantiles: Dict[str, KLLSketch] = field(default_factory=dict)
+    modes: Dict[str, HeavyHittersSketch] = field(default_factory=dict)
+
+    @classmethod
+    def from_batches(cls, batches: Iterable[Any], **kwargs) -> "SketchDescriptor":
+        sketchDescriptor = cls(**kwargs)
+        for batch in batches:
+            sketchDescriptor.update(batch)
+        return sketchDescriptor
+
+    def update(self, batch: Union[List[Dict[str, Any]], ColumnarDataset, pl.DataFrame]) -> None:
+        if isinstance(batch, pl.DataFrame):
+            batch = ColumnarDataset.from_polars(batch)
+        elif not isinstance(batch, ColumnarDataset):
+            batch = ColumnarDataset.from_dicts(batch)
+
+        self.rows += len(batch)
+
+        for column in batch.columns:
+            values = batch.valid_values(column)
+            self.nones[column] = self.nones.get(column, 0) + int(batch.null_mask(column).sum())
+            if column not in self.modes:
+                self.modes[column] = HeavyHittersSketch(self.capacity)
+            if column not in self.types and values.size > 0:
+                self.types[column] = type(values[0].item() if isinstance(values[0], np.generic)
+                                          else values[0]).__name__
+
+            if batch.is_numeric(column):
+                if column not in self.quantiles:
+                    self.quantiles[column] = KLLSketch(self.k, self.seed)
+                self.quantiles[column].update(values)
+                self.sums[column] = self.sums.get(column, 0.0) + float(np.sum(values, dtype=float))
+
+            self.modes[column].update(values if batch.is_numeric(column) else values.astype(str))
+
+    def merge(self, other: "SketchDescriptor") -> None:
+        self.rows += other.rows
+        for column, noneCount in other.nones.items():
+            self.nones[column] = self.nones.get(column, 0) + noneCount
+        for column, total in other.sums.items():
+            self.sums[column] = self.sums.get(column, 0.0) + total
+        for column, typeName in other.types.items():
+            self.types.setdefault(column, typeName)
+        for column, sketch in other.quantiles.items():
+            if column not in self.quantiles:
+                self.quantiles[column] = KLLSketch(self.k, self.seed)
+            self.quantiles[column].merge(sketch)
+        for column, sketch in other.modes.items():
+            if column not in self.modes:
+                self.modes[column] = HeavyHittersSketch(self.capacity)
+            self.modes[column].merge(sketch)
+
+    def _columns(self, columns: Union[List[str], str], numeric: bool) -> List[str]:
+        if columns == "all":
+            return list(self.quantiles.keys() if numeric else self.nones.keys())
+
+        for column in columns:
+            if column not in self.nones:
+                raise ValueError(f"Oops!  {column} was no valid column.  Try again...")
+            elif numeric and column not in self.quantiles:
+                raise ValueError(f"Oops!  {column} was no valid NUMERIC column.  Try again...")
+        return columns
+
+    def none_ratio(self, columns: Union[List[str], str] = "all") -> Dict[str, float]:
+        return {column: self.nones[column] / self.rows for column in self._columns(columns, False)}
+
+    def average(self, columns: Union[List[str], str] = "all") -> Dict[str, float]:
+        return {column: (self.sums[column] / self.quantiles[column].count
+                         if self.quantiles[column].count else None)
+                for column in self._columns(columns, True)}
+
+    def median(self, columns: Union[List[str], str] = "all") -> Dict[str, float]:
+        return {column: self.quantiles[column].quantile(0.5) for column in self._columns(columns, True)}
+
+    def percentile(self, columns: Union[List[str], str] = "all", percentile: int = 50) -> Dict[str, float]:
+        return {column: self.quantiles[column].quantile(percentile / 100)
+                for column in self._columns(columns, True)}
+
+    def type_and_mode(self, columns: Union[List[str], str] = "all") -> Dict[str,
+                                                                            Union[Tuple[str, float],
+                                                                                  Tuple[str, str]]]:
+        return {column: (self.types.get(column, "NoneType"), self.modes[column].mode())
+                for column in self._columns(columns, False)}
@@ -1,18 +1,73 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator
 import polars as pl
+from real_estate_toolkit.data.dataset import ColumnarDataset
+from real_estate_toolkit.data.cache import read_csv_cached
+
+def _rebatch(batches: Iterable[pl.DataFrame], batch_size: int) -> Iterator[pl.DataFrame]:
+    #Fixed-Size Batches (at most one extra batch buffered)
+    buffer = []
+    buffered = 0
+
+    for batch in batches:
+        buffer.append(batch)
+        buffered += len(batch)
+
+        if buffered >= batch_size:
+            df = pl.concat(buffer, rechunk=False)
+            for start in range(0, len(df) - batch_size + 1, batch_size):
+                yield df.slice(start, batch_size)
+
+            remainder = len(df) % batch_size
+            buffer = [df.slice(len(df) - remainder, remainder)] if remainder else []
+            buffered = remainder
+
+    if buffered:
+        yield pl.concat(buffer)
 
 @dataclass
 class DataLoader:
     data_path: Path
+    use_cache: bool = True
+
+    def _read_csv(self) -> pl.DataFrame:
+        if self.use_cache:
+            return read_csv_cached(self.data_path, null_values="NA")
+        return pl.read_csv(self.data_path, null_values="NA")
 
     def load_data_from_csv(self) -> List[Dict[str, Any]]:
-        df = pl.read_csv(self.data_path, null_values="NA")
+        df = self._read_csv()
         dfToDicts = df.to_dicts()
         return dfToDicts
 
+    def load_dataset_from_csv(self) -> ColumnarDataset:
+        df = self._read_csv()
+        return ColumnarDataset.from_polars(df)
+
+    def load_data_in_batches(self, batch_size: int = 100_000) -> Iterator[pl.DataFrame]:
+        if batch_size <= 0:
+            raise ValueError(f"Oops!  {batch_size} was no valid batch size.  Try again...")
+
+        lazyDf = pl.scan_csv(self.data_path, null_values="NA")
+
+        #Streaming Engine (polars >= 1.32), Batched Reader Otherwise
+        if hasattr(lazyDf, "collect_batches"):
+            batches = lazyDf.collect_batches(chunk_size=batch_size)
+        else:
+            reader = pl.read_csv_batched(self.data_path, null_values="NA", batch_size=batch_size,
+                                         schema_overrides=lazyDf.collect_schema())
+            batches = (batch for batchList in iter(lambda: reader.next_batches(1), None)
+                       for batch in batchList)
+
+        yield from _rebatch(batches, batch_size)
+
+    def load_dataset_in_batches(self, batch_size: int = 100_000) -> Iterator[ColumnarDataset]:
+        for batch in self.load_data_in_batches(batch_size):
+            yield ColumnarDataset.from_polars(batch)
+
     def validate_columns(self, required_columns: List[str]) -> bool:
-        df = pl.read_csv(self.data_path, null_values="NA")
-        validateColumns = all(column in df.columns for column in required_columns)
+        #Header Only
+        columns = pl.scan_csv(self.data_path, null_values="NA").collect_schema().names()
+        validateColumns = all(column in columns for column in required_columns)
         return validateColumns
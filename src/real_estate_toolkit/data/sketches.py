@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Iterable
+import numpy as np
+
+@dataclass
+class KLLSketch:
+    #Mergeable quantile sketch (KLL compactors). Rank error is about
+    #2.3 / k ** 0.97 of n (k=200 -> ~1.3%), independent of n; memory is O(k).
+    k: int = 200
+    seed: Optional[int] = None
+    count: int = 0
+    minimum: float = np.inf
+    maximum: float = -np.inf
+    levels: List[np.ndarray] = field(default_factory=lambda: [np.empty(0)])
+
+    def __post_init__(self):
+        if self.k < 8:
+            raise ValueError(f"Oops!  {self.k} was no valid k (minimum 8).  Try again...")
+        self._rng = np.random.default_rng(self.seed)
+
+    @property
+    def rank_error(self) -> float:
+        return 2.296 / self.k ** 0.9723
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.levels)):
+                if len(self.levels[level]) <= self._capacity(level):
+                    continue
+
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                #Sort, Keep One if Odd, Promote Every Other Item (weight x2)
+                items = np.sort(self.levels[level])
+                keep = items[:len(items) % 2]
+                items = items[len(items) % 2:]
+                promoted = items[self._rng.integers(2)::2]
+
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = keep
+                compacted = True
+
+    def update(self, values: Iterable[float]) -> None:
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        self.count += values.size
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        if other.k != self.k:
+            raise ValueError(f"Oops!  k={other.k} can not be merged into k={self.k}.  Try again...")
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress()
+
+    def to_dict(self) -> Dict[str, Any]:
+        #JSON-Ready State (the compaction rng restarts from seed on load)
+        return {"k": self.k, "seed": self.seed, "count": self.count, "minimum": self.minimum,
+                "maximum": self.maximum, "levels": [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "KLLSketch":
+        return cls(k=state["k"], seed=state["seed"], count=state["count"], minimum=state["minimum"],
+                   maximum=state["maximum"], levels=[np.asarray(items, dtype=float) for items in state["levels"]])
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        if not 0 <= q <= 1:
+            raise ValueError(f"Oops!  {q} was no valid quantile.  Try again...")
+
+        #Exact While Nothing Was Compacted
+        if len(self.levels) == 1:
+            return float(np.percentile(self.levels[0], q * 100))
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+
+        index = int(np.searchsorted(cumulative, q * cumulative[-1], side="left"))
+        value = items[min(index, len(items) - 1)]
+        return float(min(max(value, self.minimum), self.maximum))
+
+@dataclass
+class HeavyHittersSketch:
+    #Mergeable Misra-Gries summary: every count is underestimated by at most
+    #n / (capacity + 1), so any value with frequency above that is kept.
+    capacity: int = 64
+    count: int = 0
+    counters: Dict[Any, int] = field(default_factory=dict)
+
+    def _prune(self) -> None:
+        if len(self.counters) <= self.capacity:
+            return
+
+        counts = sorted(self.counters.values(), reverse=True)
+        cut = counts[self.capacity]
+        self.counters = {value: n - cut for value, n in self.counters.items() if n > cut}
+
+    def update(self, values: Iterable[Any]) -> None:
+        values = np.asarray(values)
+        if values.size == 0:
+            return
+
+        #Batch Counts First (vectorized), Then Fold Into Counters
+        unique, counts = np.unique(values, return_counts=True)
+        for value, n in zip(unique.tolist(), counts.tolist()):
+            self.counters[value] = self.counters.get(value, 0) + n
+
+        self.count += values.size
+        self._prune()
+
+    def merge(self, other: "HeavyHittersSketch") -> None:
+        for value, n in other.counters.items():
+            self.counters[value] = self.counters.get(value, 0) + n
+
+        self.count += other.count
+        self._prune()
+
+    @property
+    def error_bound(self) -> float:
+        return self.count / (self.capacity + 1)
+
+    def mode(self) -> Any:
+        if not self.counters:
+            return None
+        #Ties -> Smallest Value (same as sorted np.unique)
+        return min(self.counters.items(), key=lambda item: (-item[1], item[0]))[0]
@@ -1,22 +1,30 @@
 "Main module for running tests"
 from pathlib import Path
+from time import perf_counter
 from typing import List, Dict, Any
+from random import Random
+import warnings
+import numpy as np
 import polars as pl
 import plotly.graph_objects as go
 
 from real_estate_toolkit.data.loader import DataLoader
+from real_estate_toolkit.data.dataset import ColumnarDataset
 from real_estate_toolkit.data.cleaner import Cleaner
 from real_estate_toolkit.data.descriptor import Descriptor, DescriptorNumpy
 from real_estate_toolkit.agent_based_model.houses import House, QualityScore
 from real_estate_toolkit.agent_based_model.house_market import HousingMarket
+from real_estate_toolkit.agent_based_model.market_arrays import HouseTable, sample_truncated_normal
 from real_estate_toolkit.agent_based_model.consumers import Consumer, Segment
+from real_estate_toolkit.agent_based_model.savings import project_savings
 from real_estate_toolkit.agent_based_model.simulation import (
     Simulation, 
     CleaningMarketMechanism, 
     AnnualIncomeStatistics,
     ChildrenRange
 )
-from real_estate_toolkit.analytics.exploratory import MarketAnalyzer
+from real_estate_toolkit.analytics.exploratory import MarketAnalyzer, PLOTLY_BUNDLE
+from real_estate_toolkit.analytics.correlation import correlation_matrix
 from real_estate_toolkit.ml_models.predictor import HousePricePredictor
 
 def is_valid_snake_case(string: str) -> bool:
@@ -95,8 +103,38 @@ def test_descriptive_statistics(cleaned_data: List[Dict[str, Any]]):
     type_modes = descriptor.type_and_mode()
     type_modes_numpy = descriptor_numpy.type_and_mode()
     assert set(type_modes.keys()) == set(type_modes_numpy.keys()), "Both implementations should handle same columns"
+    # Test single-pass profile
+    profile = descriptor_numpy.describe_all(percentiles=[75])
+    assert set(profile.keys()) == set(none_ratios.keys()), "Profile should cover every column"
+    for col in numeric_columns:
+        assert abs(profile[col]["mean"] - averages[col]) < 1e-6, f"Profile average differs for {col}"
+        assert abs(profile[col]["median"] - medians[col]) < 1e-6, f"Profile median differs for {col}"
+        assert abs(profile[col]["percentiles"][75] - percentiles[col]) < 1e-6, f"Profile percentile differs for {col}"
     return numeric_columns
 
+def test_columnar_dataset(cleaned_data: List[Dict[str, Any]]):
+    """Test the columnar dataset path against the List[Dict] path"""
+    loader = DataLoader(Path("files/train.csv"))
+    dataset = loader.load_dataset_from_csv()
+    assert isinstance(dataset, ColumnarDataset), "Data should be returned as a ColumnarDataset"
+    # Test data cleaning
+    cleaner = Cleaner(dataset)
+    cleaner.rename_with_best_practices()
+    dataset = cleaner.na_to_none()
+    assert dataset.columns == list(cleaned_data[0].keys()), "Both implementations should produce same columns"
+    # Test lazy row view
+    rows = dataset.to_dicts()
+    assert len(rows) == len(cleaned_data), "Row view should have one row per record"
+    assert rows[0] == cleaned_data[0] and rows[-1] == cleaned_data[-1], "Row view should match legacy rows"
+    # Test descriptive statistics
+    numeric_columns = ["sale_price", "lot_area"]
+    assert Descriptor(dataset).none_ratio() == Descriptor(cleaned_data).none_ratio(), "None ratios should match"
+    averages = DescriptorNumpy(dataset).average(numeric_columns)
+    averages_rows = Descriptor(cleaned_data).average(numeric_columns)
+    for col in numeric_columns:
+        assert abs(averages[col] - averages_rows[col]) < 1e-6, f"Average calculations differ for {col}"
+    return dataset
+
 def test_house_functionality():
     """Test House class implementation"""
     house = House(
@@ -156,6 +194,31 @@ def test_market_functionality(cleaned_data: List[Dict[str, Any]]):
     assert len(matching_houses) > 0, "Should find at least one matching house"
     return market
 
+def test_direct_house_writes():
+    """Test that direct writes to a market's houses keep its statistics and indexes current"""
+    records = [House(id=idx, price=100000.0 * (idx + 1), area=1000.0, bedrooms=3, year_built=2000,
+                     quality_score=QualityScore.GOOD, available=True) for idx in range(4)]
+    # Same checks for House objects and for array-backed HouseView rows
+    for houses in (records, HouseTable.from_houses(records).views()):
+        market = HousingMarket(houses)
+        assert market.first_suitable_house(Segment.OPTIMIZER, 1e9, 1e9) is houses[0], "Expected the first house"
+        # Test a sale by plain assignment (how the original clean_the_market sold houses)
+        houses[0].available = False
+        assert market.calculate_availability_rate() == 0.75, "Availability rate should count the direct sale"
+        assert market.count_available_houses() == 3, "Available count should count the direct sale"
+        assert market.first_suitable_house(Segment.OPTIMIZER, 1e9, 1e9) is houses[1], "Sold houses should not be offered"
+        # Test putting a house back on the market
+        houses[0].available = True
+        assert market.count_available_houses() == 4, "Available count should count the returned house"
+        assert market.first_suitable_house(Segment.OPTIMIZER, 1e9, 1e9) is houses[0], "Returned houses should be offered"
+        # Test a price change
+        houses[1].price = 50000.0
+        assert market.calculate_average_price() == 850000.0 / 4, "Average price should follow the new price"
+        matching_houses = market.get_houses_that_meet_requirements(max_price=60000, segment=QualityScore.GOOD)
+        assert [house.id for house in matching_houses] == [1], "Price index should follow the new price"
+        houses[0].available = False
+        assert market.first_suitable_house(Segment.AVERAGE, 1e9, 1e9) is houses[1], "Candidates should follow the new price"
+
 def test_consumer_functionality(market: HousingMarket):
     """Test Consumer class implementation"""
     consumer = Consumer(
@@ -173,6 +236,15 @@ def test_consumer_functionality(market: HousingMarket):
     consumer.compute_savings(years=5)
     assert abs(consumer.savings - 164771.54) < 1e-6, "Incorrect savings calculation"
     assert consumer.savings > initial_savings, "Savings should increase over time"
+    # Test vectorised savings: per-consumer income, per-consumer-and-year saving rate
+    incomes = [10.0, 20.0, 30.0, 40.0]
+    saving_rates = [[0.1, 0.2, 0.3], [0.1, 0.1, 0.1], [0.5, 0.5, 0.5], [0.0, 0.2, 0.4]]
+    trajectory = project_savings(0.0, incomes, saving_rates, 0.05, 3)
+    for income, rates, projected in zip(incomes, saving_rates, trajectory):
+        savings = 0.0
+        for year, rate in enumerate(rates, start=1):
+            savings = (savings + income * rate) * 1.05
+            assert abs(projected[year] - savings) < 1e-9, "Vectorised savings should match the yearly loop"
     # Test house purchase
     consumer.buy_a_house(market)
     assert consumer.house is not None or market.get_houses_that_meet_requirements(
@@ -217,8 +289,84 @@ def test_simulation(cleaned_data: List[Dict[str, Any]]):
     # Test final statistics
     owners_rate = simulation.compute_owners_population_rate()
     assert 0 <= owners_rate <= 1, "Owners population rate should be between 0 and 1"
+    owners = sum(1 for consumer in simulation.consumers if consumer.house is not None)
+    assert owners_rate == owners / 100, "Running owner count should match the consumers"
+    # Test that purchases outside clean_the_market are counted
+    tenant = next(consumer for consumer in simulation.consumers if consumer.house is None)
+    tenant.savings = float("inf")
+    tenant.buy_a_house(simulation.housing_market)
+    if tenant.house is not None:
+        assert abs(simulation.compute_owners_population_rate() - (owners_rate + 1 / 100)) < 1e-12, \
+            "Owners population rate should count every purchase"
+    # Test that a direct house assignment is counted and sells the house
+    owners_rate = simulation.compute_owners_population_rate()
+    tenant = next(consumer for consumer in simulation.consumers if consumer.house is None)
+    house = next(house for house in simulation.housing_market.houses if house.available)
+    tenant.house = house
+    assert house.available is False, "Assigned house should be sold"
+    assert abs(simulation.compute_owners_population_rate() - (owners_rate + 1 / 100)) < 1e-12, \
+        "Owners population rate should count a direct assignment"
     availability_rate = simulation.compute_houses_availability_rate()
     assert 0 <= availability_rate <= 1, "Houses availability rate should be between 0 and 1"
+    # Test truncated-normal income sampling on a narrow window (capped batches) and an empty one
+    incomes = sample_truncated_normal(np.random.default_rng(0), 10000, 60000.0, 20000.0, 60000.0, 60100.0)
+    assert len(incomes) == 10000 and incomes.min() >= 60000.0 and incomes.max() <= 60100.0, \
+        "Sampled incomes should fill the narrow window"
+    try:
+        sample_truncated_normal(np.random.default_rng(0), 10, 60000.0, 20000.0, 500000.0, 500001.0)
+        raise AssertionError("A window without probability mass should be rejected")
+    except ValueError:
+        pass
+
+def test_matching_engine(cleaned_data: List[Dict[str, Any]]):
+    """Test the matching engines against the nested-loop allocation"""
+    rng = Random(7)
+    for array_backed in (False, True):
+        for mechanism in CleaningMarketMechanism:
+            simulation = Simulation(
+                housing_market_data=cleaned_data,
+                consumers_number=300,
+                years=1,
+                annual_income=AnnualIncomeStatistics(minimum=30000.0, average=60000.0,
+                                                     standard_deviation=20000.0, maximum=150000.0),
+                children_range=ChildrenRange(minimum=0, maximum=5),
+                cleaning_market_mechanism=mechanism,
+                array_backed=array_backed,
+                seed=7
+            )
+            simulation.create_housing_market()
+            simulation.create_consumers()
+            for consumer in simulation.consumers:
+                consumer.savings = rng.uniform(0, 80000)
+            houses = simulation.housing_market.houses
+            positions = {id(house): position for position, house in enumerate(houses)}
+            # Test clean_the_market: consumers in cleaning order take the first affordable available house
+            simulation.clean_the_market()
+            available = [True] * len(houses)
+            for consumer in simulation.consumers:
+                expected = next((position for position, house in enumerate(houses) if available[position]
+                                 and consumer.savings >= simulation.down_payment_percentage * house.price), None)
+                actual = positions[id(consumer.house)] if consumer.house is not None else None
+                assert actual == expected, f"clean_the_market differs from the nested loop ({mechanism.name}, array_backed={array_backed})"
+                if expected is not None:
+                    available[expected] = False
+            # Test buy_a_house: first available house of the consumer's segment within their savings
+            average_price = simulation.housing_market.calculate_average_price()
+            for consumer in simulation.consumers:
+                if consumer.house is not None:
+                    continue
+                consumer.savings = rng.uniform(0, 400000)
+                if consumer.segment == Segment.FANCY:
+                    wanted = lambda house: house.is_new_construction() and house.quality_score == QualityScore.EXCELLENT
+                elif consumer.segment == Segment.OPTIMIZER:
+                    wanted = lambda house: house.calculate_price_per_square_foot() < consumer.annual_income / 12
+                else:
+                    wanted = lambda house: house.price < average_price
+                expected = next((position for position, house in enumerate(houses)
+                                 if house.available and wanted(house) and consumer.savings >= house.price), None)
+                consumer.buy_a_house(simulation.housing_market)
+                actual = positions[id(consumer.house)] if consumer.house is not None else None
+                assert actual == expected, f"buy_a_house differs from the nested loop ({consumer.segment.name}, array_backed={array_backed})"
 
 def test_market_analyzer():
     """Test the functionality of the MarketAnalyzer class."""
@@ -252,6 +400,16 @@ def test_market_analyzer():
     except Exception as error:
         print(f"Feature correlation heatmap failed: {error}")
         return
+    # Test Spearman correlations against pandas (pairwise-complete, nulls included)
+    try:
+        columns = ["SalePrice", "LotFrontage", "MasVnrArea", "GarageYrBlt", "GrLivArea"]
+        frame = pl.read_csv(dataset_path, null_values="NA", infer_schema_length=None).select(columns)
+        matrix, _ = correlation_matrix(frame, columns, method="spearman")
+        expected = frame.to_pandas().corr(method="spearman").to_numpy()
+        assert abs(matrix - expected).max() < 1e-10, "Spearman correlations should match pandas"
+    except Exception as error:
+        print(f"Spearman correlation failed: {error}")
+        return
     # Test scatter plots
     try:
         scatter_plots = analyzer.create_scatter_plots()
@@ -260,6 +418,27 @@ def test_market_analyzer():
     except Exception as error:
         print(f"Scatter plots failed: {error}")
         return
+    # Test that every figure file is written
+    try:
+        output_paths = analyzer.wait_for_outputs()
+        assert all(Path(path).exists() for path in output_paths), "Expected every figure written to disk."
+        assert all(PLOTLY_BUNDLE in Path(path).read_text(encoding="utf-8") for path in output_paths), \
+            "Expected every figure to load the versioned plotly bundle."
+        assert (Path(analyzer.output_dir) / PLOTLY_BUNDLE).exists(), "Expected the plotly bundle written to disk."
+    except Exception as error:
+        print(f"Writing figures failed: {error}")
+        return
+    # Test binned scatter plots (grid density of all rows under the sample)
+    try:
+        binned_analyzer = MarketAnalyzer(data_path=str(dataset_path), write_outputs=False, max_points=500)
+        binned_analyzer.clean_data()
+        rows = binned_analyzer.real_state_clean_data.height
+        for name, figure in binned_analyzer.create_scatter_plots().items():
+            density = next(trace for trace in figure.data if isinstance(trace, go.Heatmap))
+            assert np.nansum(np.asarray(density.z, dtype=float)) == rows, f"Density layer of {name} should count every row."
+    except Exception as error:
+        print(f"Binned scatter plots failed: {error}")
+        return
 
 def test_house_price_predictor():
     """Test the functionality of the HousePricePredictor class."""
@@ -305,6 +484,57 @@ def test_house_price_predictor():
     except Exception as e:
         print(f"Forecasting failed: {e}")
         return
+    # Step 5: Test warm-start forecasting from the model registry
+    print("Testing model registry...")
+    try:
+        predictor.save_models()
+        warm_predictor = HousePricePredictor(train_data_path=str(train_data_path), test_data_path=str(test_data_path),
+                                             verify_data=True)
+        warm_predictor.clean_data()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            submission_path = warm_predictor.forecast_sales_price(model_type="Linear Regression")
+        assert not caught, f"Same data and versions should warm start silently: {[str(w.message) for w in caught]}"
+        assert Path(submission_path).exists(), "Submission file was not written."
+        print("Model registry passed!")
+    except Exception as e:
+        print(f"Model registry failed: {e}")
+        return
+    # Step 6: Test single-listing prediction and its latency
+    print("Testing prediction latency...")
+    try:
+        pipeline = predictor.models["Linear Regression"]
+        listings = predictor.test_data.head(100)
+        expected = pipeline.predict(listings.select(list(pipeline.feature_names_in_)).to_pandas())
+        rows = listings.to_dicts()
+        predictions = predictor.predict(rows)
+        assert all(abs(p - e) <= 1e-6 * abs(e) for p, e in zip(predictions, expected)), "Predictions should match the pipeline"
+        start = perf_counter()
+        for row in rows:
+            predictor.predict(row)
+        latency = (perf_counter() - start) / len(rows)
+        print(f"  Single-listing latency: {latency * 1e6:.1f} us")
+        assert latency < 1e-3, "Single-listing prediction should take well under a millisecond"
+        print("Prediction latency passed!")
+    except Exception as e:
+        print(f"Prediction latency failed: {e}")
+        return
+    # Step 7: Test single-listing prediction on uncleaned rows (None categories)
+    print("Testing prediction on uncleaned data...")
+    try:
+        raw_predictor = HousePricePredictor(train_data_path=str(train_data_path), test_data_path=str(test_data_path))
+        raw_predictor.train_baseline_models()
+        pipeline = raw_predictor.models["Linear Regression"]
+        listings = raw_predictor.test_data.head(100)
+        rows = listings.to_dicts()
+        assert any(value is None for row in rows for value in row.values()), "Expected rows with None values"
+        expected = pipeline.predict(listings.select(list(pipeline.feature_names_in_)).to_pandas())
+        predictions = raw_predictor.predict(rows)
+        assert all(abs(p - e) <= 1e-6 * abs(e) + 1e-6 for p, e in zip(predictions, expected)), "Predictions should match the pipeline"
+        print("Prediction on uncleaned data passed!")
+    except Exception as e:
+        print(f"Prediction on uncleaned data failed: {e}")
+        return
 
 def main():
     """Main function to run all tests"""
@@ -312,10 +542,13 @@ def main():
         # Run all tests sequentially
         cleaned_data = test_data_loading_and_cleaning()
         test_descriptive_statistics(cleaned_data)
+        test_columnar_dataset(cleaned_data)
         test_house_functionality()
         market = test_market_functionality(cleaned_data)
+        test_direct_house_writes()
         test_consumer_functionality(market)
         test_simulation(cleaned_data)
+        test_matching_engine(cleaned_data)
         test_market_analyzer()
         test_house_price_predictor()
         print("All tests passed successfully!")
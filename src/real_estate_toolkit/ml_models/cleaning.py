@@ -0,0 +1,59 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+import polars as pl
+
+@dataclass
+class CleaningTransform:
+    #Learned on train: columns with fewer than null_ratio nulls are kept,
+    #numeric nulls -> train mean, string nulls -> placeholder. Applied to
+    #any later batch (test, live listings) as one fused select.
+    null_ratio: float = 0.75
+    placeholder: str = "Missing"
+    columns: Optional[List[str]] = None
+    fill_values: Dict[str, Any] = field(default_factory=dict)
+
+    def fit(self, df: pl.DataFrame) -> "CleaningTransform":
+        threshold = len(df) * self.null_ratio
+        nullCounts = df.null_count().row(0, named=True)
+        self.columns = [column for column in df.columns if nullCounts[column] < threshold]
+
+        kept = df.select(self.columns)
+        numericColumns = kept.select(pl.col(pl.Float64), pl.col(pl.Int64)).columns
+        categoricalColumns = kept.select(pl.col(pl.Utf8)).columns
+
+        #All Means in One Pass
+        means = kept.select(pl.col(numericColumns).mean()).row(0, named=True) if numericColumns else {}
+        self.fill_values = {**means, **{column: self.placeholder for column in categoricalColumns}}
+        return self
+
+    def _check_fitted(self) -> None:
+        if self.columns is None:
+            raise ValueError("Cleaning transform is not fitted. Please run fit() first.")
+
+    def expressions(self, available: List[str]) -> List[pl.Expr]:
+        #Kept Columns Present in the Batch (e.g. no target on test data)
+        self._check_fitted()
+        return [pl.col(column).fill_null(self.fill_values[column]) if column in self.fill_values else pl.col(column)
+                for column in self.columns if column in available]
+
+    def transform(self, df: pl.DataFrame) -> pl.DataFrame:
+        return df.select(self.expressions(df.columns))
+
+    def fit_transform(self, df: pl.DataFrame) -> pl.DataFrame:
+        return self.fit(df).transform(df)
+
+    def transform_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        #Single Listing, No DataFrame (same rules as transform)
+        self._check_fitted()
+        fillValues = self.fill_values
+        return {column: fillValues.get(column) if row[column] is None else row[column]
+                for column in self.columns if column in row}
+
+    def to_dict(self) -> Dict[str, Any]:
+        self._check_fitted()
+        return {"null_ratio": self.null_ratio, "placeholder": self.placeholder,
+                "columns": self.columns, "fill_values": self.fill_values}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "CleaningTransform":
+        return cls(**state)
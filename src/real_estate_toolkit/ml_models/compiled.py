@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple, Union
+import math
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+@dataclass
+class CompiledLinearModel:
+    #A fitted (mean imputer -> scaler | constant imputer -> one-hot) ->
+    #LinearRegression pipeline folded into plain Python lookups:
+    #  price = intercept + sum(weight * x or missing weight) + sum(category weight)
+    intercept: float
+    numeric: List[Tuple[str, float, float]]
+    categorical: List[Tuple[str, Dict[Any, float], float]]
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "CompiledLinearModel":
+        preprocessor = pipeline.named_steps["preprocessor"]
+        model = pipeline.named_steps["model"]
+        if not isinstance(model, LinearRegression):
+            raise ValueError(f"Oops!  {type(model).__name__} was no linear model.  Try again...")
+
+        coefficients = np.ravel(model.coef_)
+        intercept = float(np.ravel(model.intercept_)[0])
+        numeric, categorical = [], []
+        offset = 0
+
+        for name, transformer, columns in preprocessor.transformers_:
+            if name == "num":
+                imputer, scaler = transformer.named_steps["imputer"], transformer.named_steps["scaler"]
+                #Columns Without a Training Mean Are Dropped by the Imputer
+                kept = [column for column, mean in zip(columns, imputer.statistics_) if not np.isnan(mean)]
+                weights = coefficients[offset:offset + len(kept)]
+                means = scaler.mean_ if scaler.with_mean else np.zeros(len(kept))
+                scales = scaler.scale_ if scaler.with_std else np.ones(len(kept))
+                perUnit = weights / scales
+                intercept -= float(np.dot(perUnit, means))
+                fills = imputer.statistics_[~np.isnan(imputer.statistics_)]
+                numeric = [(column, float(weight), float(weight * fill))
+                           for column, weight, fill in zip(kept, perUnit, fills)]
+                offset += len(kept)
+            elif name == "cat":
+                imputer, encoder = transformer.named_steps["imputer"], transformer.named_steps["onehot"]
+                for column, categories in zip(columns, encoder.categories_):
+                    weights = coefficients[offset:offset + len(categories)].tolist()
+                    lookup = dict(zip(categories.tolist(), weights))
+                    #NaN -> the Imputer's Constant; None Passes the Imputer and Is Its Own
+                    #Category When Seen in Training (lookup[None]); Unknown -> All-Zero Row
+                    categorical.append((column, lookup, lookup.get(imputer.fill_value, 0.0)))
+                    offset += len(categories)
+            elif name != "remainder" and transformer != "drop":
+                raise ValueError(f"Oops!  {name} was no supported transformer.  Try again...")
+
+        if offset != len(coefficients):
+            raise ValueError(f"Oops!  {offset} features do not match {len(coefficients)} weights.  Try again...")
+
+        return cls(intercept, numeric, categorical)
+
+    def predict_one(self, listing: Dict[str, Any]) -> float:
+        price = self.intercept
+        for column, weight, missing in self.numeric:
+            value = listing.get(column)
+            if value is None or (isinstance(value, float) and math.isnan(value)):
+                price += missing
+            else:
+                price += weight * value
+        for column, lookup, missing in self.categorical:
+            value = listing.get(column)
+            if isinstance(value, float) and math.isnan(value):
+                price += missing
+            else:
+                price += lookup.get(value, 0.0)
+        return price
+
+    def predict(self, listings: Union[Dict[str, Any], List[Dict[str, Any]]]) -> np.ndarray:
+        if isinstance(listings, dict):
+            listings = [listings]
+        return np.array([self.predict_one(listing) for listing in listings], dtype=float)
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
@@ -6,72 +6,76 @@ from sklearn.impute import SimpleImputer
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import (
     mean_squared_error,
     mean_absolute_error,
     r2_score,
     mean_absolute_percentage_error
 )
+from joblib import Parallel, delayed
+import numpy as np
+import pandas as pd
 import polars as pl
+import copy
 import os
+import warnings
+import sklearn
+from real_estate_toolkit.data.cache import read_csv_cached, frame_digest, atomic_write
+from real_estate_toolkit.ml_models.registry import ModelRegistry
+from real_estate_toolkit.ml_models.compiled import CompiledLinearModel
+from real_estate_toolkit.ml_models.cleaning import CleaningTransform
+from real_estate_toolkit.ml_models.selection import SEARCH_SPACES, search_model
 
+def _fit_model(model, X, y):
+    return model.fit(X, y)
 
 
 class HousePricePredictor:
-    def __init__(self, train_data_path: str, test_data_path: str):
+    def __init__(self, train_data_path: str, test_data_path: str, use_cache: bool = True,
+                 registry: Optional[ModelRegistry] = None,
+                 verify_data: bool = False):
+        readCsv = read_csv_cached if use_cache else pl.read_csv
         try:
-            self.train_data = pl.read_csv(train_data_path,
-                                          null_values="NA")
-            self.test_data = pl.read_csv(test_data_path,
-                                         null_values="NA")
+            self.train_data = readCsv(train_data_path,
+                                      null_values="NA")
+            self.test_data = readCsv(test_data_path,
+                                     null_values="NA")
         except Exception as e:
             raise ValueError(f"Error loading data: {e}")
         self.models = {}
+        self.metrics = {}
+        self._compiled: Dict[str, CompiledLinearModel] = {}
+        #(train data digest, target, predictors) -> (fitted preprocessor, X_train, X_test, y_train, y_test),
+        #features already transformed (sparse when one-hot columns dominate)
+        self._preprocessed: Dict[Tuple[str, str, Optional[Tuple[str, ...]]], Tuple[Any, ...]] = {}
+        self.cleaning: Optional[CleaningTransform] = None
+        #Persisted Pipelines, Loaded on First Use
+        self.registry = registry if registry is not None else ModelRegistry()
+        #Warm Starts Hash the Whole train_data Only When Asked (schema/version checks are cheap)
+        self.verify_data = verify_data
 
 
 
     def clean_data(self):
-        def clean(df: pl.DataFrame) -> pl.DataFrame:
-            #Missing Values
-            threshold = len(df) * 0.75
-            cols_to_keep = [
-                col for col in df.columns if df[col].null_count() < threshold
-            ]
-
-            df = df.select(cols_to_keep)
-
-            #Fill with Mean (Numeric)
-            numeric_cols = df.select(pl.col(pl.Float64),
-                                     pl.col(pl.Int64)).columns
-            for col in numeric_cols:
-                mean_value = df[col].mean()
-                df = df.with_columns(
-                    pl.col(col).fill_null(mean_value).alias(col)
-                )
-
-            #Fill with Placeholder (Categorical)
-            categorical_cols = df.select(pl.col(pl.Utf8)).columns
-            for col in categorical_cols:
-                df = df.with_columns(
-                    pl.col(col).fill_null("Missing").alias(col)
-                )
-
-            return df
+        #Learned on Train, Applied to Train and Test (one select each)
+        self.cleaning = CleaningTransform().fit(self.train_data)
+        self.train_data = self.cleaning.transform(self.train_data)
+        self.test_data = self.cleaning.transform(self.test_data)
 
-        self.train_data = clean(self.train_data)
-        self.test_data = clean(self.test_data)
 
 
-
-    def prepare_features(self, target_column: str = "SalePrice",
-                         selected_predictors: List[str] = None):
+    def _features(self, target_column: str = "SalePrice",
+                  selected_predictors: List[str] = None) -> Tuple[pl.DataFrame, pl.Series]:
         X = self.train_data.drop(target_column)
         y = self.train_data[target_column]
 
         if selected_predictors:
             X = X.select(selected_predictors)
 
+        return X, y
+
+    def _build_preprocessor(self, X: pl.DataFrame) -> ColumnTransformer:
         #Split Numeric and Categorical Features
         numeric_features = X.select(pl.col(pl.Float64),
                                     pl.col(pl.Int64)).columns
@@ -91,13 +95,18 @@ class HousePricePredictor:
         ])
 
         #combine both
-        self.preprocessor = ColumnTransformer(
+        return ColumnTransformer(
             transformers=[
                 ("num", numeric_transformer, numeric_features),
                 ("cat", categorical_transformer, categorical_features)
             ]
         )
 
+    def prepare_features(self, target_column: str = "SalePrice",
+                         selected_predictors: List[str] = None):
+        X, y = self._features(target_column, selected_predictors)
+        self.preprocessor = self._build_preprocessor(X)
+
         X_train, X_test, y_train, y_test = train_test_split(X.to_pandas(),
                                                             y.to_pandas(),
                                                             test_size=0.2,
@@ -107,23 +116,47 @@ class HousePricePredictor:
 
 
 
-    def train_baseline_models(self) -> Dict[str, Dict[str, float]]:
-        X_train, X_test, y_train, y_test = self.prepare_features()
+    def preprocess_features(self, target_column: str = "SalePrice",
+                            selected_predictors: List[str] = None):
+        #Fit the Preprocessor Once per (data, target, predictors), Reuse the Transformed Split
+        key = (frame_digest(self.train_data), target_column,
+               tuple(selected_predictors) if selected_predictors else None)
+
+        if key not in self._preprocessed:
+            X_train, X_test, y_train, y_test = self.prepare_features(target_column, selected_predictors)
+            Xt_train = self.preprocessor.fit_transform(X_train)
+            Xt_test = self.preprocessor.transform(X_test)
+            #Latest Split Only (older train data is never reused)
+            self._preprocessed.clear()
+            self._preprocessed[key] = (self.preprocessor, Xt_train, Xt_test, y_train, y_test)
+
+        self.preprocessor = self._preprocessed[key][0]
+        return self._preprocessed[key][1:]
+
+
+
+    def train_baseline_models(self, n_jobs: int = -1) -> Dict[str, Dict[str, float]]:
+        Xt_train, Xt_test, y_train, y_test = self.preprocess_features()
 
         models = {
             "Linear Regression": LinearRegression(),
-            "Random Forest": RandomForestRegressor(random_state=42)
+            "Random Forest": RandomForestRegressor(random_state=42, n_jobs=n_jobs)
         }
 
+        #Candidates in Parallel (threads: the forest already fans out over cores)
+        fitted = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_fit_model)(model, Xt_train, y_train) for model in models.values()
+        )
+
         results = {}
 
-        for model_name, model in models.items():
-            pipeline = Pipeline(steps=[("preprocessor", self.preprocessor), ("model", model)])
-            pipeline.fit(X_train, y_train)
+        for model_name, model in zip(models, fitted):
+            #Own Copy per Pipeline (refitting one must not change the others)
+            pipeline = Pipeline(steps=[("preprocessor", copy.deepcopy(self.preprocessor)), ("model", model)])
             self.models[model_name] = pipeline
+            self._compiled.pop(model_name, None)
 
-            y_train_pred = pipeline.predict(X_train)
-            y_test_pred = pipeline.predict(X_test)
+            y_test_pred = model.predict(Xt_test)
 
             results[model_name] = {
                 "metrics": {
@@ -134,21 +167,116 @@ class HousePricePredictor:
                 },
                 "model": pipeline
             }
+            self.metrics[model_name] = results[model_name]["metrics"]
 
         return results
 
 
 
-    def forecast_sales_price(self, model_type: str = "Linear Regression"):
-        #model_type
+    def tune_models(self, model_names: List[str] = None,
+                    target_column: str = "SalePrice",
+                    selected_predictors: List[str] = None,
+                    n_splits: int = 5,
+                    n_candidates: Any = "exhaust",
+                    n_jobs: int = -1,
+                    cache_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        #K-Fold Successive-Halving Search per Model; Best Refit on All Rows
+        X, y = self._features(target_column, selected_predictors)
+        preprocessor = self._build_preprocessor(X)
+        X, y = X.to_pandas(), y.to_pandas()
+
+        results = {}
+
+        for model_name in model_names or list(SEARCH_SPACES):
+            if model_name not in SEARCH_SPACES:
+                raise ValueError(f"Oops!  {model_name} was no valid model.  Try again...")
+            space = SEARCH_SPACES[model_name]
+            results[model_name] = search_model(preprocessor, space["estimator"], space["params"], X, y,
+                                               n_splits=n_splits, n_candidates=n_candidates,
+                                               n_jobs=n_jobs, cache_dir=cache_dir)
+
+            tunedName = f"{model_name} (tuned)"
+            self.models[tunedName] = results[model_name]["model"]
+            self.metrics[tunedName] = results[model_name]["metrics"]
+
+        return results
+
+
+
+    def save_models(self, model_types: List[str] = None) -> Dict[str, str]:
+        #Trained Pipelines -> Registry (input schema + holdout metrics)
+        paths = {}
+        for model_type in model_types or list(self.models):
+            pipeline = self.models[model_type]
+            schema = {column: str(self.train_data.schema[column]) for column in pipeline.feature_names_in_}
+            cleaning = self.cleaning.to_dict() if self.cleaning is not None else None
+            paths[model_type] = str(self.registry.save(model_type, pipeline, schema, self.metrics.get(model_type),
+                                                       train_data_digest=frame_digest(self.train_data),
+                                                       cleaning=cleaning))
+        return paths
+
+    def _check_registered(self, model_type: str, metadata: Dict[str, Any]) -> None:
+        #Registered Input Schema Must Match the Data We Forecast On (any int/float width is numeric)
+        kind = lambda dtype: "numeric" if dtype.startswith(("Int", "UInt", "Float")) else dtype
+        schema = {column: str(dtype) for column, dtype in self.test_data.schema.items()}
+        mismatched = {column: (dtype, schema.get(column))
+                      for column, dtype in metadata["schema"].items()
+                      if column not in schema or kind(schema[column]) != kind(dtype)}
+        if mismatched:
+            raise ValueError(f"Oops!  {model_type} expects other columns/dtypes (expected, got): {mismatched}.  Try again...")
+
+        if metadata.get("sklearn_version") != sklearn.__version__:
+            warnings.warn(f"{model_type} was saved with scikit-learn {metadata.get('sklearn_version')}, "
+                          f"running {sklearn.__version__}; predictions may differ.")
+        if self.verify_data and metadata.get("train_data_digest") != frame_digest(self.train_data):
+            warnings.warn(f"{model_type} was trained on different data than the current train_data.")
+
+    def load_model(self, model_type: str):
+        #In-Memory Model, Otherwise Warm Start From the Registry (no training)
         if model_type not in self.models:
-            raise ValueError(f"Model type {model_type} is not trained. Available models: {list(self.models.keys())}")
+            if model_type not in self.registry:
+                available = sorted(set(self.models) | set(self.registry.names()))
+                raise ValueError(f"Model type {model_type} is not trained. Available models: {available}")
+            metadata = self.registry.metadata(model_type)
+            self._check_registered(model_type, metadata)
+            self.models[model_type] = self.registry.load(model_type)
+            self.metrics[model_type] = metadata["metrics"]
+            #Serve With the Cleaning the Model Was Trained On
+            if self.cleaning is None and metadata.get("cleaning") is not None:
+                self.cleaning = CleaningTransform.from_dict(metadata["cleaning"])
+        return self.models[model_type]
+
+
+
+    def predict(self, listings: Union[Dict[str, Any], List[Dict[str, Any]]],
+                model_type: str = "Linear Regression") -> Union[float, np.ndarray]:
+        #One Listing -> float, a Batch -> array; No polars/pandas Round-Trip for Linear Models
+        pipeline = self.load_model(model_type)
+        rows = [listings] if isinstance(listings, dict) else listings
+        if self.cleaning is not None:
+            rows = [self.cleaning.transform_row(row) for row in rows]
+
+        if isinstance(pipeline.named_steps["model"], LinearRegression):
+            if model_type not in self._compiled:
+                self._compiled[model_type] = CompiledLinearModel.from_pipeline(pipeline)
+            predictions = self._compiled[model_type].predict(rows)
+        else:
+            frame = pd.DataFrame.from_records(rows, columns=list(pipeline.feature_names_in_))
+            for name, _, columns in pipeline.named_steps["preprocessor"].transformers_:
+                if name == "num":
+                    frame[columns] = frame[columns].astype(float)
+            predictions = pipeline.predict(frame)
+
+        return float(predictions[0]) if isinstance(listings, dict) else predictions
 
-        #Preprocessing
-        pipeline = self.models[model_type]
 
-        #Generate Predictions
-        predictions = pipeline.predict(self.test_data.to_pandas())
+
+    def forecast_sales_price(self, model_type: str = "Linear Regression"):
+        #model_type
+        pipeline = self.load_model(model_type)
+
+        #Generate Predictions (only the model's input columns go to pandas)
+        predictions = pipeline.predict(self.test_data.select(list(pipeline.feature_names_in_)).to_pandas())
 
 
 
@@ -160,8 +288,7 @@ class HousePricePredictor:
 
         #Save the File
         output_dir = "src/real_estate_toolkit/ml_models/outputs/"
-        os.makedirs(output_dir, exist_ok=True)
         submission_path = os.path.join(output_dir, "submission.csv")
-        submission.write_csv(submission_path)
+        atomic_write(submission_path, submission.write_csv)
 
         return submission_path
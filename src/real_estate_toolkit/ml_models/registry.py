@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+import json
+import re
+import joblib
+import sklearn
+from real_estate_toolkit.data.cache import atomic_write
+
+REGISTRY_DIR = "src/real_estate_toolkit/ml_models/outputs/registry/"
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+@dataclass
+class ModelRegistry:
+    #One directory per model: model.joblib (uncompressed, so arrays load
+    #memory-mapped) + metadata.json (input schema, metrics, versions)
+    root: Union[str, Path] = REGISTRY_DIR
+    _loaded: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self.root = Path(self.root)
+
+    def _directory(self, name: str) -> Path:
+        return self.root / _slug(name)
+
+    def save(self, name: str, pipeline: Any, schema: Dict[str, str],
+             metrics: Optional[Dict[str, float]] = None, **extra: Any) -> Path:
+        directory = self._directory(name)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        metadata = {
+            "name": name,
+            "created": datetime.now(timezone.utc).isoformat(),
+            "schema": schema,
+            "metrics": {metric: float(value) for metric, value in (metrics or {}).items()},
+            "sklearn_version": sklearn.__version__,
+            **extra
+        }
+
+        #Model First, Metadata Last: Metadata Marks a Complete Entry
+        atomic_write(directory / "model.joblib", lambda path: joblib.dump(pipeline, path))
+        atomic_write(directory / "metadata.json",
+                     lambda path: Path(path).write_text(json.dumps(metadata, indent=2), encoding="utf-8"))
+
+        self._loaded[name] = pipeline
+        return directory
+
+    def names(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(json.loads(path.read_text(encoding="utf-8"))["name"]
+                      for path in self.root.glob("*/metadata.json"))
+
+    def __contains__(self, name: str) -> bool:
+        return (self._directory(name) / "metadata.json").exists()
+
+    def metadata(self, name: str) -> Dict[str, Any]:
+        path = self._directory(name) / "metadata.json"
+        if not path.exists():
+            raise ValueError(f"Oops!  {name} was no registered model.  Try again...")
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def load(self, name: str) -> Any:
+        #Loaded Once per Registry, Read-Only Memory-Mapped Arrays
+        if name not in self._loaded:
+            if name not in self:
+                raise ValueError(f"Oops!  {name} was no registered model.  Try again...")
+            self._loaded[name] = joblib.load(self._directory(name) / "model.joblib", mmap_mode="r")
+        return self._loaded[name]
@@ -0,0 +1,87 @@
+from typing import Dict, Any, Optional
+from time import perf_counter
+import tempfile
+from joblib import Memory
+from scipy.stats import randint, loguniform
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import KFold, HalvingRandomSearchCV, cross_validate
+from sklearn.pipeline import Pipeline
+from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
+
+#Candidate Models and Their Hyperparameter Distributions (pipeline step "model")
+SEARCH_SPACES: Dict[str, Dict[str, Any]] = {
+    "Random Forest": {
+        "estimator": RandomForestRegressor(random_state=42),
+        "params": {
+            "model__n_estimators": [100, 200, 400],
+            "model__max_depth": [None, 10, 20, 30],
+            "model__min_samples_split": randint(2, 11),
+            "model__min_samples_leaf": randint(1, 5),
+            "model__max_features": ["sqrt", 0.33, 0.5, 1.0]
+        }
+    },
+    "Gradient Boosting": {
+        "estimator": GradientBoostingRegressor(random_state=42),
+        "params": {
+            "model__n_estimators": [100, 200, 400],
+            "model__learning_rate": loguniform(0.01, 0.3),
+            "model__max_depth": [2, 3, 4, 5],
+            "model__subsample": [0.7, 0.85, 1.0],
+            "model__min_samples_leaf": randint(1, 10)
+        }
+    }
+}
+
+#cross_validate Scorers -> Reported Metric (sklearn scorers are negated errors)
+SCORING = {
+    "MSE": "neg_mean_squared_error",
+    "MAE": "neg_mean_absolute_error",
+    "R2": "r2",
+    "MAPE": "neg_mean_absolute_percentage_error"
+}
+
+def search_model(preprocessor, estimator, params: Dict[str, Any], X, y,
+                 n_splits: int = 5, n_candidates: Any = "exhaust", factor: int = 3,
+                 n_jobs: int = -1, random_state: int = 42,
+                 cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    #Successive Halving Over Random Candidates (poor ones stop at small sample
+    #sizes), K-Fold CV; the preprocessor fit per fold/sample size is cached
+    #on disk, so candidates sharing a fold reuse it instead of refitting.
+    with tempfile.TemporaryDirectory() as tmpDir:
+        memory = Memory(cache_dir or tmpDir, verbose=0)
+        pipeline = Pipeline(steps=[("preprocessor", clone(preprocessor)), ("model", clone(estimator))],
+                            memory=memory)
+        folds = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+
+        start = perf_counter()
+        search = HalvingRandomSearchCV(pipeline, params, n_candidates=n_candidates, factor=factor,
+                                       cv=folds, scoring=SCORING["MSE"], n_jobs=n_jobs,
+                                       random_state=random_state, refit=True)
+        search.fit(X, y)
+        searchTime = perf_counter() - start
+
+        #Best Candidate, Every Metric, Same Folds
+        start = perf_counter()
+        scores = cross_validate(search.best_estimator_, X, y, cv=folds, scoring=SCORING, n_jobs=n_jobs)
+        cvTime = perf_counter() - start
+
+        best = search.best_estimator_
+        best.set_params(memory=None)
+
+    metrics = {}
+    for metric in SCORING:
+        values = scores[f"test_{metric}"]
+        sign = 1 if metric == "R2" else -1
+        metrics[metric] = float(sign * values.mean())
+        metrics[f"{metric}_std"] = float(values.std())
+
+    return {
+        "best_params": {name.removeprefix("model__"): value.item() if hasattr(value, "item") else value
+                        for name, value in search.best_params_.items()},
+        "metrics": metrics,
+        "wall_time": {"search": searchTime, "cross_validation": cvTime},
+        "n_candidates": int(search.n_candidates_[0]),
+        "n_iterations": int(search.n_iterations_),
+        "model": best
+    }